@@ -9,6 +9,7 @@ import os
 import sys
 import subprocess
 import shutil
+import importlib.util
 import json
 import logging
 from pathlib import Path
@@ -223,6 +224,36 @@ class BuildSystem:
             self.logger.error(f"テスト実行エラー: {e}")
             return False
     
+    def compile_native_helpers(self) -> bool:
+        """純粋関数のヘルパーモジュールをmypycでコンパイル
+
+        mypyc（mypy に同梱）が使えない環境ではスキップしてPython実装を使う。
+        コンパイルに失敗した場合は False を返す（ビルドは中止せずPython実装のまま続行）。
+        """
+        if importlib.util.find_spec("mypyc") is None:
+            self.logger.info("mypycが見つからないためネイティブヘルパーのコンパイルをスキップします")
+            return True
+        
+        self.logger.info("ネイティブヘルパーのコンパイルを開始します")
+        
+        modules = [str(self.project_root / "reports" / "_fmt.py")]
+        try:
+            result = subprocess.run(
+                [sys.executable, "-m", "mypyc", *modules],
+                cwd=self.project_root, capture_output=True, text=True
+            )
+            
+            if result.returncode == 0:
+                self.logger.info("ネイティブヘルパーのコンパイルが完了しました")
+                return True
+            
+            self.logger.error(f"mypycコンパイルエラー: {result.stderr}")
+            return False
+            
+        except Exception as e:
+            self.logger.error(f"mypyc実行エラー: {e}")
+            return False
+    
     def build_executable(self) -> bool:
         """実行ファイルをビルド"""
         self.logger.info("実行ファイルのビルドを開始します")
@@ -393,6 +424,7 @@ class BuildSystem:
             steps.append(("テスト実行", self.run_tests))
         
         steps.extend([
+            ("ネイティブヘルパーコンパイル", self.compile_native_helpers),
             ("実行ファイルビルド", self.build_executable),
             ("インストーラー作成", self.create_installer)
         ])
@@ -403,8 +435,9 @@ class BuildSystem:
             if not step_func():
                 self.logger.error(f"{step_name}が失敗しました")
                 success = False
-                # テスト以外の失敗はビルドを中止
-                if step_name != "テスト実行":
+                # テスト・ネイティブヘルパー以外の失敗はビルドを中止
+                # （ヘルパーはPython実装でも動作するため、失敗を記録して続行する）
+                if step_name not in ("テスト実行", "ネイティブヘルパーコンパイル"):
                     break
         
         # ビルドレポート生成
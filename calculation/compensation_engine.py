@@ -8,12 +8,24 @@
 from decimal import Decimal, ROUND_HALF_UP
 from datetime import date, datetime
 from typing import Dict, Any, Optional, Tuple, List
+import copy
+import hashlib
+import json
 import logging
+from collections import OrderedDict
 from dataclasses import dataclass
+from functools import cached_property
 
 from models import CaseData, PersonInfo, AccidentInfo, MedicalInfo, IncomeInfo
 from utils.error_handler import get_error_handler, CalculationError, ErrorSeverity # 追加
 
+# 個別項目の計算に失敗した場合に 0円の結果へ付ける備考（キャッシュ対象の判定にも使う）
+CALCULATION_FAILED_NOTE = "計算できませんでした"
+
+def _escape_markup(text: str) -> str:
+    """ReportLab Paragraph のマークアップとして解釈されないよう特殊文字をエスケープする"""
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
 @dataclass
 class CalculationResult:
     """計算結果データクラス"""
@@ -22,6 +34,35 @@ class CalculationResult:
     calculation_details: str
     legal_basis: str = ""
     notes: str = ""
+
+    # PDF表の計算根拠欄に表示する計算詳細の最大文字数
+    HTML_DETAILS_MAX_LENGTH = 100
+
+    @cached_property
+    def amount_int(self) -> int:
+        """表示用に円単位へ丸めた金額（整数の書式化はDecimalより高速なため一度だけ変換する）"""
+        return round(self.amount)
+
+    @cached_property
+    def html_details(self) -> str:
+        """PDF用に組み立てた計算根拠・備考のHTML（初回生成後はキャッシュを返す）
+
+        法的根拠・備考の有無は生成時に一度だけ判定し、結果の文字列に反映する。
+        """
+        details = self.calculation_details or ""
+        max_length = self.HTML_DETAILS_MAX_LENGTH
+        # 省略記号は1文字の「…」を使う（PDFのコンテンツストリームも短くなる）
+        details = details[:max_length] + "…" if len(details) > max_length else details
+        details_html = _escape_markup(details).replace("\n", "<br/>")
+        if not (self.legal_basis or self.notes):
+            # 法的根拠・備考がない場合はリストの組み立てを省略する
+            return details_html or "-"
+        parts = [details_html] if details_html else []
+        if self.legal_basis:
+            parts.append(f"<b>法的根拠:</b> {_escape_markup(self.legal_basis)}")
+        if self.notes:
+            parts.append(f"<b>備考:</b> {_escape_markup(self.notes)}")
+        return "<br/>".join(parts) or "-"
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -35,9 +76,14 @@ class CalculationResult:
 class CompensationEngine:
     """弁護士基準損害賠償計算エンジン"""
     
+    # calculate_all の結果キャッシュに保持する案件数の上限
+    RESULT_CACHE_SIZE = 128
+    
     def __init__(self):
         self.logger = logging.getLogger(__name__)
         self._error_handler = get_error_handler() # 追加
+        # 計算に使う入力のハッシュ -> 計算結果（同じ入力の再計算を省く。最近使った順に並べるLRU）
+        self._result_cache: "OrderedDict[bytes, Dict[str, CalculationResult]]" = OrderedDict()
         self.init_standards()
     
     def init_standards(self):
@@ -94,6 +140,8 @@ class CompensationEngine:
             61: 27.840, 62: 28.000, 63: 28.155, 64: 28.306, 65: 28.453,
             66: 28.595, 67: 28.733
         }
+        # 期間 -> ライプニッツ係数（Decimal変換・近似計算の結果を期間ごとに1回だけ求める）
+        self._leibniz_cache: Dict[int, Decimal] = {}
         
         # 年齢別平均余命（簡易版）
         self.life_expectancy = {
@@ -116,8 +164,11 @@ class CompensationEngine:
         """指定された期間のライプニッツ係数を取得します。"""
         if period <= 0:
             return Decimal('0')
+        cached = self._leibniz_cache.get(period)
+        if cached is not None:
+            return cached
         if period in self.leibniz_coefficients:
-            return Decimal(str(self.leibniz_coefficients[period]))
+            coefficient = Decimal(str(self.leibniz_coefficients[period]))
         else:
             # 辞書にない場合は近似計算 (3%の利率を想定)
             # (1 - (1 + 利率)^(-期間)) / 利率
@@ -125,7 +176,7 @@ class CompensationEngine:
                 rate = Decimal('0.03')
                 leibniz = (Decimal('1') - (Decimal('1') + rate) ** -period) / rate
                 # 小数点以下3桁で四捨五入（一般的なライプニッツ係数の表示に合わせる）
-                return leibniz.quantize(Decimal('0.001'), rounding=ROUND_HALF_UP)
+                coefficient = leibniz.quantize(Decimal('0.001'), rounding=ROUND_HALF_UP)
             except Exception as e:
                 calc_err = CalculationError(
                     message=f"ライプニッツ係数の近似計算エラー (期間: {period}): {e}",
@@ -136,6 +187,12 @@ class CompensationEngine:
                 self._error_handler.handle_exception(e, context=calc_err.context)
                 # Noneを返すか、エラーを再送するかは設計次第。ここではNoneを返す。
                 return None
+        self._leibniz_cache[period] = coefficient
+        return coefficient
+
+    def _get_labor_capacity_loss_ratio(self, grade: Optional[int]) -> Optional[int]:
+        """後遺障害等級の労働能力喪失率（%）を取得します。対応範囲外の等級は None。"""
+        return self.disability_loss_rate.get(grade)
 
     def calculate_hospitalization_compensation(self, medical_info: MedicalInfo) -> CalculationResult:
         """入通院慰謝料の計算"""
@@ -195,7 +252,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {calc_err.user_message}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
         except Exception as e:
             calc_err = CalculationError(
@@ -210,7 +267,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {str(e)}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
     
     def calculate_disability_compensation(self, medical_info: MedicalInfo) -> CalculationResult:
@@ -279,7 +336,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {str(e)}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
     
     def calculate_lost_income(self, income_info: IncomeInfo) -> CalculationResult:
@@ -325,7 +382,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {calc_err.user_message}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
         except Exception as e:
             calc_err = CalculationError(
@@ -340,7 +397,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {str(e)}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
     
     def calculate_future_income_loss(self, person_info: PersonInfo, medical_info: MedicalInfo, income_info: IncomeInfo) -> CalculationResult:
@@ -364,7 +421,8 @@ class CompensationEngine:
             
             # 労働能力喪失率
             grade = medical_info.disability_grade
-            if grade not in self.disability_loss_rate:
+            loss_ratio = self._get_labor_capacity_loss_ratio(grade)
+            if loss_ratio is None:
                 return CalculationResult(
                     item_name="後遺障害逸失利益",
                     amount=Decimal('0'),
@@ -372,7 +430,7 @@ class CompensationEngine:
                     legal_basis="",
                     notes=""
                 )
-            loss_rate = Decimal(str(self.disability_loss_rate[grade])) / 100
+            loss_rate = Decimal(loss_ratio) / 100
             loss_period = income_info.loss_period_years
             # ライプニッツ係数
             leibniz = self.get_leibniz_coefficient(loss_period) # 修正: メソッド呼び出しに変更
@@ -419,7 +477,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {calc_err.user_message}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
         except TypeError as e: # 数値計算時の型エラー
             calc_err = CalculationError(
@@ -439,7 +497,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {calc_err.user_message}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
         except Exception as e:
             calc_err = CalculationError(
@@ -459,7 +517,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {str(e)}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
     
     def calculate_medical_expenses(self, medical_info: MedicalInfo) -> CalculationResult:
@@ -498,7 +556,7 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {calc_err.user_message}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
             )
         except Exception as e:
             calc_err = CalculationError(
@@ -513,11 +571,34 @@ class CompensationEngine:
                 amount=Decimal('0'),
                 calculation_details=f"計算エラー: {str(e)}",
                 legal_basis="",
-                notes="計算できませんでした"
+                notes=CALCULATION_FAILED_NOTE
+            )
+    
+    @staticmethod
+    def _result_cache_key(case_data: CaseData) -> Optional[bytes]:
+        """計算結果キャッシュのキー（計算に使う人物・医療・収入情報のハッシュ。作れない場合は None）"""
+        try:
+            payload = json.dumps(
+                [case_data.person_info.to_dict(), case_data.medical_info.to_dict(), case_data.income_info.to_dict()],
+                ensure_ascii=False, sort_keys=True, default=str
             )
+        except Exception:
+            return None
+        return hashlib.blake2b(payload.encode('utf-8'), digest_size=16).digest()
+    
+    @staticmethod
+    def _copy_results(results: Dict[str, CalculationResult]) -> Dict[str, CalculationResult]:
+        """呼び出し側の変更がキャッシュに及ばないよう計算結果を複製する"""
+        return {key: copy.copy(result) for key, result in results.items()}
     
     def calculate_all(self, case_data: CaseData) -> Dict[str, CalculationResult]:
-        """全損害項目の計算"""
+        """全損害項目の計算（同じ入力の2回目以降はキャッシュした結果の複製を返す）"""
+        cache_key = self._result_cache_key(case_data)
+        cached = self._result_cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
+            self._result_cache.move_to_end(cache_key)
+            return self._copy_results(cached)
+        
         results = {}
         try:
             # 各項目の計算
@@ -560,6 +641,13 @@ class CompensationEngine:
                 legal_basis="民法第709条、第722条",
                 notes="弁護士費用は概算です。実際の費用は事務所の基準により異なります"
             )
+            # 全項目を正常に計算できた結果のみキャッシュする（上限を超えたら最も長く使われていないものを捨てる）
+            if cache_key is not None and not any(
+                result.notes == CALCULATION_FAILED_NOTE for result in results.values()
+            ):
+                if len(self._result_cache) >= self.RESULT_CACHE_SIZE:
+                    self._result_cache.popitem(last=False)
+                self._result_cache[cache_key] = self._copy_results(results)
             return results
 
         except CalculationError as e: # 既に処理済みの CalculationError
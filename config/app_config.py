@@ -6,6 +6,7 @@
 """
 
 import json
+import hashlib
 import logging
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
@@ -188,6 +189,7 @@ class SecurityConfig:
     data_retention_days: int = 365  # セキュリティマネージャー互換性のため
     anonymization_threshold_days: int = 730
     audit_logging_enabled: bool = True  # セキュリティマネージャー互換性のため
+    audit_sink: str = "sqlite"  # 監査ログの記録先（"sqlite": ファイル, "memory": メモリ上のみ）
     # 設定ファイルから読み込まれる追加の属性
     master_key_env_var: str = "COMP_SYS_MASTER_KEY"
     secure_db_path: str = "database/secure_storage.db"
@@ -262,6 +264,7 @@ class ConfigManager:
     _instance = None
     _config: Optional[AppConfig] = None
     _config_file_path: Optional[Path] = None
+    _config_hash: Optional[str] = None  # 最後に読み込み・保存した設定ファイル内容のハッシュ
     _error_handler: ErrorHandler # 追加
     logger: logging.Logger # loggerを追加
 
@@ -292,17 +295,37 @@ class ConfigManager:
         """デフォルト設定を作成"""
         return AppConfig()
 
+    @staticmethod
+    def _hash_content(raw: bytes) -> str:
+        """設定ファイル内容のハッシュを計算"""
+        return hashlib.blake2b(raw, digest_size=16).hexdigest()
+
+    def load_config(self, force: bool = False):
+        """設定ファイルを再読み込み（内容が前回の読み込み・保存時から変わっていなければ再解析しない）"""
+        if force:
+            self._config_hash = None
+        self._load_config()
+
     def _load_config(self):
         if self._config_file_path and self._config_file_path.exists():
             try:
-                with open(self._config_file_path, 'r', encoding='utf-8') as f:
-                    config_dict = json.load(f)
+                with open(self._config_file_path, 'rb') as f:
+                    raw = f.read()
+                
+                # 内容が変わっていなければ解析済みの設定をそのまま使う
+                content_hash = self._hash_content(raw)
+                if self._config is not None and content_hash == self._config_hash:
+                    self.logger.debug(f"設定ファイルに変更がないため再解析を省略しました: {self._config_file_path}")
+                    return
+                
+                config_dict = json.loads(raw.decode('utf-8'))
                 
                 # バージョンチェックと移行処理
                 config_dict = self._migrate_config_if_needed(config_dict)
                 
                 # 設定オブジェクトを作成
                 self._config = self._dict_to_config(config_dict)
+                self._config_hash = content_hash
                 self.logger.info(f"設定ファイルを読み込みました: {self._config_file_path}")
             except FileNotFoundError:
                 if self._error_handler:
@@ -361,8 +384,13 @@ class ConfigManager:
                 )
                 return
 
-            with open(save_path, 'w', encoding='utf-8') as f:
-                json.dump(config_dict, f, ensure_ascii=False, indent=2)
+            raw = json.dumps(config_dict, ensure_ascii=False, indent=2).encode('utf-8')
+            with open(save_path, 'wb') as f:
+                f.write(raw)
+            
+            # 保存内容はメモリ上の設定と一致するため、直後の再読み込みでは解析を省略できる
+            if save_path == self._config_file_path:
+                self._config_hash = self._hash_content(raw)
             
             logging.info(f"設定ファイルを保存しました: {self._config_file_path}")
             
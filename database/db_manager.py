@@ -8,15 +8,22 @@ SQLiteデータベース管理システム
 import sqlite3
 import logging
 import json
-import shutil
+import hashlib
+from contextlib import contextmanager
 from datetime import datetime, timedelta, date
+from enum import Enum
 from pathlib import Path
-from typing import Any, List, Dict, Optional, Tuple, Union, Callable
+from typing import Any, List, Dict, Optional, Tuple, Union, Callable, Iterator
 
 from utils.error_handler import get_error_handler, DatabaseError, ErrorSeverity
 from config.app_config import ConfigManager
 from models import CaseData
 
+try:
+    import orjson # C実装の高速JSON（任意依存）
+except ImportError:
+    orjson = None
+
 # ロギング設定
 logging.basicConfig(
     level=logging.INFO,
@@ -24,10 +31,107 @@ logging.basicConfig(
     datefmt='%Y-%m-%d %H:%M:%S'
 )
 
+# tuning="fast" で接続ごとに適用するPRAGMA
+# synchronous=NORMAL はコミット時のfsyncを省くため、電源断時に直近のコミットが失われうる。
+# tmp_path 上のテスト用DBなど、耐久性より速度を優先してよい一時DB専用とする。
+_FAST_TUNING_PRAGMAS = (
+    "PRAGMA journal_mode=WAL;",
+    "PRAGMA synchronous=NORMAL;",
+    "PRAGMA temp_store=MEMORY;",
+    "PRAGMA busy_timeout=5000;",
+)
+
+def _json_default(obj: Any) -> Any:
+    """JSONで直接表せない値の変換（orjson・標準 json の両方で使う）
+
+    dataclass や日時は従来の保存形式どおり str() で文字列にする。Enum は値を使う。
+    """
+    if isinstance(obj, Enum):
+        return obj.value
+    return str(obj)
+
+# orjson が dataclass・日時を独自に変換せず _json_default に渡すようにするオプション
+_ORJSON_OPTIONS = (
+    orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None else 0
+)
+
+def _json_dumps(obj: Any) -> str:
+    """JSON文字列に変換（orjson があれば使い、なければ標準の json で同じ内容を出力する）
+
+    保存内容や content_hash が orjson の有無で変わらないよう、変換方法と区切り文字を揃えている。
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, default=_json_default, option=_ORJSON_OPTIONS).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, default=_json_default, separators=(",", ":"))
+
+def _json_loads(json_str: Union[str, bytes]) -> Any:
+    """JSON文字列を読み込む（orjson.JSONDecodeError は json.JSONDecodeError のサブクラス）"""
+    if orjson is not None:
+        return orjson.loads(json_str)
+    return json.loads(json_str)
+
+# load_case のSELECT。毎回同じSQL文字列を使うことで sqlite3 の文キャッシュ（準備済み文の再利用）が効く。
+# 列順は load_case でのタプル展開の順序と一致させること。
+_LOAD_CASE_SQL = """
+    SELECT case_number, created_date, last_modified, status,
+           person_info, accident_info, medical_info, income_info,
+           notes, custom_fields, calculation_results
+    FROM cases WHERE case_number = ? AND is_archived = 0
+"""
+
+# load_cases_bulk のSELECT（列順は _LOAD_CASE_SQL と同じ。placeholders に "?, ?, ..." を埋め込む）
+_LOAD_CASES_BULK_SQL = """
+    SELECT case_number, created_date, last_modified, status,
+           person_info, accident_info, medical_info, income_info,
+           notes, custom_fields, calculation_results
+    FROM cases WHERE case_number IN ({placeholders}) AND is_archived = 0
+"""
+
+# 1回の IN 句に渡す案件番号の上限（古い SQLite のバインド変数上限 999 を超えないようにする）
+_BULK_LOAD_CHUNK_SIZE = 500
+
+# search_cases が返す辞書のキー（SELECT の列順と一致させること）
+_SEARCH_CASE_COLUMNS = ('id', 'case_number', 'created_date', 'last_modified', 'status', 'client_name', 'accident_date')
+
+class _BulkConnection:
+    """bulk_write 中に共有接続の代わりに渡すラッパー
+
+    コミット・ロールバックは bulk_write がブロック終了時にまとめて行うため、各メソッドからの
+    commit() / rollback() と with ブロック終了時のコミットは何もしない。その他の属性は共有接続に委譲する。
+    """
+
+    def __init__(self, conn: sqlite3.Connection):
+        self._conn = conn
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._conn, name)
+
+    def commit(self) -> None:
+        pass
+
+    def rollback(self) -> None:
+        pass
+
+    def __enter__(self) -> "_BulkConnection":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        return False
+
 class DatabaseManager:
     """SQLiteデータベース管理クラス"""
     
-    def __init__(self, db_path: Union[str, Path], config_manager: Optional[ConfigManager] = None, logger: Optional[logging.Logger] = None):
+    def __init__(self, db_path: Union[str, Path], config_manager: Optional[ConfigManager] = None, logger: Optional[logging.Logger] = None,
+                 tuning: Optional[str] = None):
+        """tuning="fast" を指定すると耐久性を緩めたPRAGMAで接続する（一時DB・テスト用）
+
+        db_path に ":memory:" を指定するとファイルを作らないメモリ上のDBを使う（in_memory() 参照）。
+        "file:" で始まる文字列は SQLite の URI として開く（例: "file:testdb?mode=memory&cache=shared"）。
+        """
+        if tuning not in (None, "fast"):
+            raise ValueError(f"未対応のtuning指定です: {tuning}")
+        self.tuning = tuning
         self.db_path = Path(db_path)
         self.logger = logger or logging.getLogger(__name__)
         self._error_handler = get_error_handler() # 追加
@@ -39,6 +143,10 @@ class DatabaseManager:
         self.connection_timeout = db_config.connection_timeout_seconds
         self.backup_dir = Path(db_config.backup_dir)
         self.max_backup_files = db_config.max_backup_files
+        self._conn: Optional[sqlite3.Connection] = None # インスタンスで使い回す接続（close() で閉じる）
+        self._bulk_conn: Optional[_BulkConnection] = None # bulk_write 中に共有接続の代わりに渡すラッパー
+        # "file:" で始まるパスはURIとして開く（":memory:" は共有接続1本で使うため通常のメモリDBとして開く）
+        self._uri: Optional[str] = str(db_path) if str(db_path).startswith("file:") else None
 
         if not self.db_path.parent.exists():
             try:
@@ -48,17 +156,29 @@ class DatabaseManager:
                 self._error_handler.handle_exception(e, context=err.context)
                 raise err from e # 再送してアプリケーションの起動を妨げる
         
-        self._create_connection() # 初期接続試行
+        # 初期接続（以後の操作で使い回す。メモリDBは最後の接続が閉じると消えるため、その寿命も兼ねる）
+        self._conn = self._create_connection()
         self._initialize_db() # 初期化
+
+    @classmethod
+    def in_memory(cls, config_manager: Optional[ConfigManager] = None, logger: Optional[logging.Logger] = None) -> "DatabaseManager":
+        """メモリ上のDBを使うデータベースマネージャーを作成（永続化やバックアップを伴わないテスト用）"""
+        return cls(":memory:", config_manager=config_manager, logger=logger)
     
     def _create_connection(self) -> sqlite3.Connection:
         try:
-            conn = sqlite3.connect(self.db_path, timeout=self.connection_timeout, check_same_thread=False)
+            if self._uri:
+                conn = sqlite3.connect(self._uri, timeout=self.connection_timeout, check_same_thread=False, uri=True)
+            else:
+                conn = sqlite3.connect(self.db_path, timeout=self.connection_timeout, check_same_thread=False)
             conn.row_factory = sqlite3.Row
             if self.journal_mode:
                 conn.execute(f"PRAGMA journal_mode={self.journal_mode};")
             if self.enable_foreign_keys:
                 conn.execute("PRAGMA foreign_keys = ON;")
+            if self.tuning == "fast":
+                for pragma in _FAST_TUNING_PRAGMAS:
+                    conn.execute(pragma)
             self.logger.info(f"データベースに接続しました: {self.db_path}")
             return conn
         except sqlite3.Error as e:
@@ -76,14 +196,70 @@ class DatabaseManager:
             conn.close()
             self.logger.info(f"データベース接続を閉じました: {self.db_path}")
 
+    def _connection(self) -> sqlite3.Connection:
+        """インスタンスで使い回す接続を取得（close() 後は開き直す）"""
+        if self._conn is None:
+            self._conn = self._create_connection()
+        return self._conn
+
+    def close(self):
+        """使い回している接続を閉じる（メモリDBの場合は内容も破棄される）"""
+        conn, self._conn = self._conn, None
+        self._close_connection(conn)
+
     def get_connection(self):
-        """データベース接続をコンテキストマネージャーとして取得"""
-        return self._create_connection()
+        """データベース接続をコンテキストマネージャーとして取得
+
+        接続はインスタンスで使い回すため、with ブロックの終了時はコミット（例外時はロールバック）のみ行い、閉じない。
+        bulk_write 中はコミットを bulk_write に任せるラッパーを返す。
+        """
+        if self._bulk_conn is not None:
+            return self._bulk_conn
+        return self._connection()
+
+    @contextmanager
+    def bulk_write(self) -> Iterator[_BulkConnection]:
+        """複数の save_case を1つのトランザクションにまとめるコンテキストマネージャー
+
+        ブロック内の save_case は同じ接続を使い、コミットはブロック終了時に1回だけ行う
+        （例外発生時はロールバック）。保存ごとのコミット（WALのfsync）を省けるため大量保存が速くなる。
+        ネストした呼び出しは外側のトランザクションにそのまま参加する。
+        トランザクションは共有接続上で BEGIN ... COMMIT として行うため、ブロック内の読み込みは未コミットの行も参照できる。
+        ブロック内で get_connection() や execute_query(commit=True) を使うメソッドのコミットも、ブロック終了時の1回にまとまる。
+        """
+        if self._bulk_conn is not None:
+            yield self._bulk_conn
+            return
+        conn = self._connection()
+        conn.execute("BEGIN")
+        self._bulk_conn = _BulkConnection(conn)
+        try:
+            yield self._bulk_conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            self._bulk_conn = None
+
+    @contextmanager
+    def _write_connection(self) -> Iterator[sqlite3.Connection]:
+        """書き込み用の接続を取得する。bulk_write 中はその接続を返し、コミットは bulk_write に任せる"""
+        if self._bulk_conn is not None:
+            yield self._bulk_conn
+            return
+        conn = self._connection()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
 
     def execute_query(self, query: str, params: Optional[Union[Dict[str, Any], Tuple[Any, ...]]] = None, commit: bool = False, fetch_one: bool = False, fetch_all: bool = False) -> Any:
         conn = None
         try:
-            conn = self._create_connection()
+            conn = self.get_connection()
             cursor = conn.cursor()
             self.logger.debug(f"Executing query: {query} with params: {params}")
             if params:
@@ -141,13 +317,11 @@ class DatabaseManager:
             self._error_handler.handle_exception(e, context=unknown_err.context)
             if conn: conn.rollback()
             raise unknown_err from e
-        finally:
-            self._close_connection(conn)
 
     def execute_script(self, script: str) -> None:
         conn = None
         try:
-            conn = self._create_connection()
+            conn = self._connection()
             cursor = conn.cursor()
             self.logger.info("Executing script...")
             cursor.executescript(script)
@@ -163,8 +337,6 @@ class DatabaseManager:
             self._error_handler.handle_exception(e, context=db_err.context)
             if conn: conn.rollback()
             raise db_err from e
-        finally:
-            self._close_connection(conn)
 
     def _initialize_db(self):
         """データベースの初期化（テーブル作成など）"""
@@ -185,7 +357,8 @@ class DatabaseManager:
                 calculation_results TEXT,
                 notes TEXT,
                 custom_fields TEXT DEFAULT '{}',
-                is_archived BOOLEAN DEFAULT 0
+                is_archived BOOLEAN DEFAULT 0,
+                content_hash TEXT
             );
             """
             
@@ -242,6 +415,11 @@ class DatabaseManager:
             self.execute_query(create_settings_table)
             self.execute_query(create_templates_table)
             
+            # 既存データベースへの列追加（content_hash は後から追加された列）
+            case_columns = {row[1] for row in self.execute_query("PRAGMA table_info(cases);", fetch_all=True)}
+            if 'content_hash' not in case_columns:
+                self.execute_query("ALTER TABLE cases ADD COLUMN content_hash TEXT;")
+            
             # インデックス作成
             self.execute_query("CREATE INDEX IF NOT EXISTS idx_cases_case_number ON cases (case_number);")
             self.execute_query("CREATE INDEX IF NOT EXISTS idx_cases_client_name ON cases (client_name);")
@@ -273,27 +451,29 @@ class DatabaseManager:
             
         try:
             case_data.last_modified = datetime.now()
+            body, content_hash, calculation_results = self._serialize_case(case_data)
             
-            with self.get_connection() as conn:
+            with self._write_connection() as conn:
                 cursor = conn.cursor()
                 
                 # 既存データの確認
-                cursor.execute('SELECT id FROM cases WHERE case_number = ?', (case_data.case_number,))
+                cursor.execute('SELECT id, content_hash FROM cases WHERE case_number = ?', (case_data.case_number,))
                 existing = cursor.fetchone()
                 
-                # JSONシリアライゼーションの安全化
-                def safe_json_dumps(obj):
-                    """安全なJSON変換"""
-                    try:
-                        if hasattr(obj, 'to_dict'):
-                            return json.dumps(obj.to_dict(), ensure_ascii=False, default=str)
-                        else:
-                            return json.dumps(obj, ensure_ascii=False, default=str)
-                    except (TypeError, ValueError) as e:
-                        self.logger.warning(f"JSON変換エラー（空辞書で代替）: {e}")
-                        return json.dumps({}, ensure_ascii=False)
-                
-                if existing:
+                if existing and existing[1] == content_hash:
+                    # 本体が変わっていなければ計算結果のみ更新
+                    cursor.execute('''
+                        UPDATE cases SET
+                            last_modified = ?,
+                            calculation_results = ?
+                        WHERE case_number = ?
+                    ''', (
+                        case_data.last_modified.isoformat(),
+                        calculation_results,
+                        case_data.case_number
+                    ))
+                    self.logger.info(f"案件データを更新しました（計算結果のみ）: {case_data.case_number}")
+                elif existing:
                     # 更新
                     cursor.execute('''
                         UPDATE cases SET
@@ -305,18 +485,14 @@ class DatabaseManager:
                             income_info = ?,
                             notes = ?,
                             custom_fields = ?,
-                            calculation_results = ?
+                            calculation_results = ?,
+                            content_hash = ?
                         WHERE case_number = ?
                     ''', (
                         case_data.last_modified.isoformat(),
-                        case_data.status or '作成中',
-                        safe_json_dumps(case_data.person_info),
-                        safe_json_dumps(case_data.accident_info),
-                        safe_json_dumps(case_data.medical_info),
-                        safe_json_dumps(case_data.income_info),
-                        case_data.notes or '',
-                        safe_json_dumps(case_data.custom_fields or {}),
-                        safe_json_dumps(case_data.calculation_results or {}),
+                        *body,
+                        calculation_results,
+                        content_hash,
                         case_data.case_number
                     ))
                     self.logger.info(f"案件データを更新しました: {case_data.case_number}")
@@ -326,24 +502,19 @@ class DatabaseManager:
                         INSERT INTO cases (
                             case_number, created_date, last_modified, status,
                             person_info, accident_info, medical_info, income_info,
-                            notes, custom_fields, calculation_results
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                            notes, custom_fields, calculation_results, content_hash
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
                     ''', (
                         case_data.case_number,
                         (case_data.created_date or datetime.now()).isoformat(),
                         case_data.last_modified.isoformat(),
-                        case_data.status or '作成中',
-                        safe_json_dumps(case_data.person_info),
-                        safe_json_dumps(case_data.accident_info),
-                        safe_json_dumps(case_data.medical_info),
-                        safe_json_dumps(case_data.income_info),
-                        case_data.notes or '',
-                        safe_json_dumps(case_data.custom_fields or {}),
-                        safe_json_dumps(case_data.calculation_results or {})
+                        *body,
+                        calculation_results,
+                        content_hash
                     ))
                     self.logger.info(f"新規案件データを作成しました: {case_data.case_number}")
                 
-                conn.commit()
+                # コミットは _write_connection（bulk_write 中はブロック終了時）が行う
                 return True
                 
         except sqlite3.IntegrityError as e:
@@ -353,6 +524,181 @@ class DatabaseManager:
             self.logger.error(f"案件保存エラー: {e}")
             return False
 
+    def update_calculation_results(self, case_number: str, calculation_results: Dict[str, Any]) -> bool:
+        """計算結果の列のみを更新（案件本体の列は書き換えない）"""
+        try:
+            with self._write_connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute('''
+                    UPDATE cases SET
+                        last_modified = ?,
+                        calculation_results = ?
+                    WHERE case_number = ? AND is_archived = 0
+                ''', (
+                    datetime.now().isoformat(),
+                    _json_dumps(calculation_results or {}),
+                    case_number
+                ))
+                
+                if cursor.rowcount == 0:
+                    self.logger.warning(f"計算結果の更新対象の案件が見つかりません: {case_number}")
+                    return False
+                
+                self.logger.info(f"計算結果を更新しました: {case_number}")
+                return True
+                
+        except (TypeError, ValueError) as e:
+            self.logger.error(f"計算結果のJSON変換エラー: {case_number} - {e}")
+            return False
+        except Exception as e:
+            self.logger.error(f"計算結果更新エラー: {case_number} - {e}")
+            return False
+
+    def save_cases(self, cases: List[CaseData]) -> bool:
+        """複数案件を1回の executemany で保存（新規作成・更新両対応、1トランザクション）"""
+        if any(not case_data or not case_data.case_number for case_data in cases):
+            self.logger.error("無効な案件データが含まれています: case_numberが空です")
+            return False
+        
+        try:
+            now = datetime.now()
+            rows = []
+            for case_data in cases:
+                case_data.last_modified = now
+                body, content_hash, calculation_results = self._serialize_case(case_data)
+                rows.append((
+                    case_data.case_number,
+                    (case_data.created_date or now).isoformat(),
+                    now.isoformat(),
+                    *body,
+                    calculation_results,
+                    content_hash
+                ))
+            
+            with self._write_connection() as conn:
+                # 既存案件は id・作成日時を保ったまま更新する（INSERT OR REPLACE は行を作り直すため使わない）
+                conn.executemany('''
+                    INSERT INTO cases (
+                        case_number, created_date, last_modified, status,
+                        person_info, accident_info, medical_info, income_info,
+                        notes, custom_fields, calculation_results, content_hash
+                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(case_number) DO UPDATE SET
+                        last_modified = excluded.last_modified,
+                        status = excluded.status,
+                        person_info = excluded.person_info,
+                        accident_info = excluded.accident_info,
+                        medical_info = excluded.medical_info,
+                        income_info = excluded.income_info,
+                        notes = excluded.notes,
+                        custom_fields = excluded.custom_fields,
+                        calculation_results = excluded.calculation_results,
+                        content_hash = excluded.content_hash
+                ''', rows)
+            
+            self.logger.info(f"案件データを一括保存しました: {len(rows)}件")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"案件一括保存エラー: {e}")
+            return False
+
+    def _serialize_case(self, case_data: CaseData) -> Tuple[Tuple[str, ...], str, str]:
+        """案件の本体列・本体ハッシュ・計算結果をシリアライズ"""
+        # JSONシリアライゼーションの安全化
+        def safe_json_dumps(obj):
+            """安全なJSON変換"""
+            try:
+                if hasattr(obj, 'to_dict'):
+                    return _json_dumps(obj.to_dict())
+                else:
+                    return _json_dumps(obj)
+            except (TypeError, ValueError) as e:
+                self.logger.warning(f"JSON変換エラー（空辞書で代替）: {e}")
+                return json.dumps({}, ensure_ascii=False)
+        
+        # 計算結果以外の本体列（前回保存時との差分検出のためハッシュを取る）
+        body = (
+            case_data.status or '作成中',
+            safe_json_dumps(case_data.person_info),
+            safe_json_dumps(case_data.accident_info),
+            safe_json_dumps(case_data.medical_info),
+            safe_json_dumps(case_data.income_info),
+            case_data.notes or '',
+            safe_json_dumps(case_data.custom_fields or {}),
+        )
+        return body, self._content_hash(body), safe_json_dumps(case_data.calculation_results or {})
+
+    @staticmethod
+    def _content_hash(body: Tuple[str, ...]) -> str:
+        """案件本体列（シリアライズ済み）のハッシュを計算"""
+        return hashlib.blake2b("\x1f".join(body).encode("utf-8"), digest_size=16).hexdigest()
+
+    def _row_to_case(self, row: Tuple[Any, ...]) -> CaseData:
+        """_LOAD_CASE_SQL の列順のタプル行から CaseData を復元"""
+        (row_case_number, created_date, last_modified, status,
+         person_info, accident_info, medical_info, income_info,
+         notes, custom_fields, calculation_results) = row
+        
+        def safe_json_loads(json_str, default=None):
+            """安全なJSON読み込み"""
+            if not json_str:
+                return default or {}
+            try:
+                return _json_loads(json_str)
+            except (json.JSONDecodeError, TypeError) as e:
+                self.logger.warning(f"JSON読み込みエラー（デフォルト値で代替）: {e}")
+                return default or {}
+        
+        case_data = CaseData()
+        case_data.case_number = row_case_number
+        
+        # 日付の安全な変換
+        try:
+            case_data.created_date = datetime.fromisoformat(created_date)
+        except (ValueError, TypeError):
+            case_data.created_date = datetime.now()
+            self.logger.warning(f"作成日時の変換に失敗: {created_date}")
+        
+        try:
+            case_data.last_modified = datetime.fromisoformat(last_modified)
+        except (ValueError, TypeError):
+            case_data.last_modified = datetime.now()
+            self.logger.warning(f"更新日時の変換に失敗: {last_modified}")
+        
+        case_data.status = status or '作成中'
+        
+        # 各情報セクションの安全な読み込み
+        try:
+            person_data = safe_json_loads(person_info)
+            case_data.person_info = case_data.person_info.from_dict(person_data)
+        except Exception as e:
+            self.logger.warning(f"個人情報の読み込みエラー: {e}")
+            
+        try:
+            accident_data = safe_json_loads(accident_info)
+            case_data.accident_info = case_data.accident_info.from_dict(accident_data)
+        except Exception as e:
+            self.logger.warning(f"事故情報の読み込みエラー: {e}")
+            
+        try:
+            medical_data = safe_json_loads(medical_info)
+            case_data.medical_info = case_data.medical_info.from_dict(medical_data)
+        except Exception as e:
+            self.logger.warning(f"医療情報の読み込みエラー: {e}")
+            
+        try:
+            income_data = safe_json_loads(income_info)
+            case_data.income_info = case_data.income_info.from_dict(income_data)
+        except Exception as e:
+            self.logger.warning(f"収入情報の読み込みエラー: {e}")
+        
+        case_data.notes = notes or ""
+        case_data.custom_fields = safe_json_loads(custom_fields, {})
+        case_data.calculation_results = safe_json_loads(calculation_results, {})
+        
+        return case_data
+    
     def load_case(self, case_number: str) -> Optional[CaseData]:
         """案件番号で案件データを読み込み"""
         if not case_number or not case_number.strip():
@@ -362,67 +708,12 @@ class DatabaseManager:
         try:
             with self.get_connection() as conn:
                 cursor = conn.cursor()
-                cursor.execute('SELECT * FROM cases WHERE case_number = ? AND is_archived = 0', (case_number.strip(),))
+                cursor.row_factory = None # sqlite3.Row を作らずタプルで受け取る
+                cursor.execute(_LOAD_CASE_SQL, (case_number.strip(),))
                 row = cursor.fetchone()
                 
                 if row:
-                    def safe_json_loads(json_str, default=None):
-                        """安全なJSON読み込み"""
-                        if not json_str:
-                            return default or {}
-                        try:
-                            return json.loads(json_str)
-                        except (json.JSONDecodeError, TypeError) as e:
-                            self.logger.warning(f"JSON読み込みエラー（デフォルト値で代替）: {e}")
-                            return default or {}
-                    
-                    case_data = CaseData()
-                    case_data.case_number = row['case_number']
-                    
-                    # 日付の安全な変換
-                    try:
-                        case_data.created_date = datetime.fromisoformat(row['created_date'])
-                    except (ValueError, TypeError):
-                        case_data.created_date = datetime.now()
-                        self.logger.warning(f"作成日時の変換に失敗: {row['created_date']}")
-                    
-                    try:
-                        case_data.last_modified = datetime.fromisoformat(row['last_modified'])
-                    except (ValueError, TypeError):
-                        case_data.last_modified = datetime.now()
-                        self.logger.warning(f"更新日時の変換に失敗: {row['last_modified']}")
-                    
-                    case_data.status = row['status'] or '作成中'
-                    
-                    # 各情報セクションの安全な読み込み
-                    try:
-                        person_data = safe_json_loads(row['person_info'])
-                        case_data.person_info = case_data.person_info.from_dict(person_data)
-                    except Exception as e:
-                        self.logger.warning(f"個人情報の読み込みエラー: {e}")
-                        
-                    try:
-                        accident_data = safe_json_loads(row['accident_info'])
-                        case_data.accident_info = case_data.accident_info.from_dict(accident_data)
-                    except Exception as e:
-                        self.logger.warning(f"事故情報の読み込みエラー: {e}")
-                        
-                    try:
-                        medical_data = safe_json_loads(row['medical_info'])
-                        case_data.medical_info = case_data.medical_info.from_dict(medical_data)
-                    except Exception as e:
-                        self.logger.warning(f"医療情報の読み込みエラー: {e}")
-                        
-                    try:
-                        income_data = safe_json_loads(row['income_info'])
-                        case_data.income_info = case_data.income_info.from_dict(income_data)
-                    except Exception as e:
-                        self.logger.warning(f"収入情報の読み込みエラー: {e}")
-                    
-                    case_data.notes = row['notes'] or ""
-                    case_data.custom_fields = safe_json_loads(row['custom_fields'], {})
-                    case_data.calculation_results = safe_json_loads(row['calculation_results'], {})
-                    
+                    case_data = self._row_to_case(row)
                     self.logger.debug(f"案件データを正常に読み込みました: {case_number}")
                     return case_data
                 else:
@@ -433,6 +724,31 @@ class DatabaseManager:
         
         return None
     
+    def load_cases_bulk(self, case_numbers: List[str]) -> List[CaseData]:
+        """複数の案件を IN 句でまとめて読み込み（見つからない・アーカイブ済みの案件は含まない）"""
+        numbers = list(dict.fromkeys(n.strip() for n in case_numbers if n and n.strip()))
+        if not numbers:
+            return []
+        
+        cases = []
+        try:
+            with self.get_connection() as conn:
+                cursor = conn.cursor()
+                cursor.row_factory = None # sqlite3.Row を作らずタプルで受け取る
+                for i in range(0, len(numbers), _BULK_LOAD_CHUNK_SIZE):
+                    chunk = numbers[i:i + _BULK_LOAD_CHUNK_SIZE]
+                    cursor.execute(
+                        _LOAD_CASES_BULK_SQL.format(placeholders=", ".join("?" * len(chunk))),
+                        chunk
+                    )
+                    cases.extend(self._row_to_case(row) for row in cursor.fetchall())
+        except Exception as e:
+            self.logger.error(f"案件一括読み込みエラー: {e}")
+            return []
+        
+        self.logger.debug(f"案件データを一括で読み込みました: {len(cases)}/{len(numbers)}件")
+        return cases
+    
     def load_case_by_id(self, case_id: int) -> Optional[Dict[str, Any]]:
         """案件IDで案件データを読み込み（辞書形式で返す）"""
         try:
@@ -512,10 +828,10 @@ class DatabaseManager:
                 query += ' ORDER BY last_modified DESC LIMIT ?'
                 params.append(limit)
                 
+                cursor.row_factory = None # sqlite3.Row を経由せずタプルから辞書を作る
                 cursor.execute(query, params)
-                rows = cursor.fetchall()
                 
-                return [dict(row) for row in rows]
+                return [dict(zip(_SEARCH_CASE_COLUMNS, row)) for row in cursor]
                 
         except Exception as e:
             self.logger.error(f"案件検索エラー: {e}")
@@ -549,21 +865,26 @@ class DatabaseManager:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             backup_file = backup_path / f"compensation_db_backup_{timestamp}.db"
             
-            shutil.copy2(self.db_path, backup_file)
+            # SQLite のオンラインバックアップAPIでページ単位にコピーする
+            # （ファイルコピーと違い、WALに残っている未チェックポイントの更新も含まれる）
+            source_conn = self._connection()
+            dest_conn = sqlite3.connect(backup_file)
+            try:
+                source_conn.backup(dest_conn)
+            finally:
+                dest_conn.close()
             
             # バックアップ記録を保存
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    INSERT INTO backup_records (backup_date, backup_file_path, backup_type, file_size)
-                    VALUES (?, ?, ?, ?)
-                ''', (
-                    datetime.now().isoformat(),
-                    str(backup_file),
-                    "自動バックアップ",
-                    backup_file.stat().st_size
-                ))
-                conn.commit()
+            source_conn.execute('''
+                INSERT INTO backup_records (backup_date, backup_path, file_size, success)
+                VALUES (?, ?, ?, ?)
+            ''', (
+                datetime.now().isoformat(),
+                str(backup_file),
+                backup_file.stat().st_size,
+                True
+            ))
+            source_conn.commit()
             
             self.logger.info(f"バックアップを作成しました: {backup_file}")
             return True
@@ -745,7 +1066,7 @@ class DatabaseManager:
 
     # バッチ処理とメンテナンス機能
     def batch_save_cases(self, cases: List[CaseData]) -> Dict[str, Any]:
-        """複数案件の一括保存"""
+        """複数案件の一括保存（案件ごとに成否を集計し、コミットは bulk_write で1回にまとめる）"""
         results = {
             'success_count': 0,
             'failed_count': 0,
@@ -753,23 +1074,20 @@ class DatabaseManager:
         }
         
         try:
-            with self.get_connection() as conn:
-                cursor = conn.cursor()
-                
+            with self.bulk_write():
                 for case_data in cases:
+                    case_number = case_data.case_number if case_data else None
                     try:
-                        # 個別の保存処理（トランザクション内で実行）
-                        if self._save_single_case_in_transaction(cursor, case_data):
+                        if self.save_case(case_data):
                             results['success_count'] += 1
                         else:
                             results['failed_count'] += 1
-                            results['errors'].append(f"保存失敗: {case_data.case_number}")
+                            results['errors'].append(f"保存失敗: {case_number}")
                     except Exception as e:
                         results['failed_count'] += 1
-                        results['errors'].append(f"{case_data.case_number}: {str(e)}")
-                
-                conn.commit()
-                self.logger.info(f"バッチ保存完了: 成功{results['success_count']}件、失敗{results['failed_count']}件")
+                        results['errors'].append(f"{case_number}: {str(e)}")
+            
+            self.logger.info(f"バッチ保存完了: 成功{results['success_count']}件、失敗{results['failed_count']}件")
                 
         except Exception as e:
             self.logger.error(f"バッチ保存エラー: {e}")
@@ -777,12 +1095,6 @@ class DatabaseManager:
         
         return results
 
-    def _save_single_case_in_transaction(self, cursor, case_data: CaseData) -> bool:
-        """トランザクション内での単一案件保存（内部使用）"""
-        # save_caseメソッドのロジックをトランザクション用に分離
-        # 実装詳細は省略（必要に応じて追加）
-        return True
-
     def optimize_database(self) -> bool:
         """データベースの最適化とメンテナンス"""
         try:
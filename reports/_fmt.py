@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+レポート用の金額フォーマットヘルパー
+
+ReportLab に依存しない純粋関数のみを置き、mypyc でネイティブ拡張に
+コンパイルできるよう型注釈を付けている（build_system.py 参照）。
+コンパイルされていない環境ではそのまま Python 実装が使われる。
+"""
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def format_yen(amount_int: int) -> str:
+    """整数金額を「1,234 円」形式に整形する（同一金額はキャッシュから返す）"""
+    return f"{amount_int:,} 円"
+
+
+@lru_cache(maxsize=4096)
+def format_number(amount_int: int) -> str:
+    """整数金額を桁区切りのみで整形する（単位なし）"""
+    return f"{amount_int:,}"
+
+
+@lru_cache(maxsize=256, typed=True)  # 10 と 10.0 は表示が異なるため型ごとにキャッシュする
+def format_percent(value: float) -> str:
+    """割合の数値部分を整形する（従来の表示どおり str と同じ形式: 10 は「10」、10.0 は「10.0」）"""
+    return f"{value}"
+
+
+@lru_cache(maxsize=256, typed=True)  # 3 と 3.0（True と 1）は表示が異なるため型ごとにキャッシュする
+def format_unit(value: int, unit: str) -> str:
+    """「3 ヶ月」「20 日」のような数値＋単位の表示ラベルを整形する（取りうる値が少ないためキャッシュする）"""
+    return f"{value} {unit}"
+
+
+@lru_cache(maxsize=16)
+def format_grade(grade: int) -> str:
+    """後遺障害等級を「第 N 級」形式に整形する"""
+    return f"第 {grade} 級"
@@ -64,7 +64,7 @@ class ExcelReportGeneratorOptimized:
         """ディレクトリの設定と作成"""
         try:
             # 出力ディレクトリ
-            self.output_dir = Path(self.report_config.output_directory)
+            self.output_dir = Path(self.report_config.default_output_directory)
             self.output_dir.mkdir(parents=True, exist_ok=True)
             
             # テンプレートディレクトリ
@@ -200,14 +200,19 @@ class ExcelReportGeneratorOptimized:
 
     @monitor_performance("excel_report_generation", track_parameters=True)
     def create_compensation_report(self, case_data: CaseData, results: Dict[str, CalculationResult], 
-                                 output_filename: str, template_type: str = "default") -> bool:
-        """損害賠償計算書の作成 - パフォーマンス最適化版"""
+                                 output_filename: str, template_type: str = "default",
+                                 lightweight: bool = False) -> bool:
+        """損害賠償計算書の作成 - パフォーマンス最適化版
+
+        lightweight=True の場合はテンプレート・詳細計算・追加シート・ロゴを省き、メインシートの基本項目のみを作成する
+        （出力内容の体裁を問わない用途向け。既定では従来どおりの帳票を作成する）
+        """
         try:
             self.logger.info(f"損害賠償計算書の作成を開始します: {output_filename}")
             
             # テンプレートが指定されている場合は適用
             wb = None
-            if self.report_config.enable_template_customization and template_type != "none":
+            if not lightweight and self.report_config.enable_template_customization and template_type != "none":
                 wb = self.template_manager.apply_template(template_type, case_data)
                 if wb is None:
                     self.logger.warning(f"テンプレート '{template_type}' の適用に失敗したため、新規作成します")
@@ -219,8 +224,11 @@ class ExcelReportGeneratorOptimized:
             ws = wb.active
             ws.title = "損害賠償計算書"
             
-            # 設定から表示項目を取得
+            # 設定から表示項目を取得（軽量モードでは詳細計算・追加シート・ロゴを作成しない）
             report_items = self.report_config.excel_report_items
+            if lightweight:
+                report_items = [item for item in report_items
+                                if item not in ("detailed_calculation_table", "charts", "reference_materials", "logo")]
             
             # シート作成（メソッド分割でパフォーマンス向上）
             self._create_calculation_sheet(ws, case_data, results, report_items)
@@ -260,6 +268,33 @@ class ExcelReportGeneratorOptimized:
             )
             return False
 
+    def generate_batch_reports(self, case_list: List[Dict], template_type: str = "default") -> List[str]:
+        """複数ケースのバッチレポート生成（各要素の 'template_type' / 'filename' で個別指定も可能）"""
+        generated_files = []
+        
+        try:
+            self.performance_monitor.start_timing('batch_excel_generation')
+            
+            for i, case_info in enumerate(case_list):
+                case_template_type = case_info.get('template_type', template_type)
+                filename = case_info.get('filename') or f"batch_report_{i+1:03d}_{case_template_type}.xlsx"
+                
+                if self.create_compensation_report(
+                    case_info['case_data'], case_info['results'], filename, case_template_type
+                ):
+                    generated_files.append(str(self._get_output_path(filename)))
+                else:
+                    self.logger.error(f"バッチ処理 {i+1} でExcel帳票の作成に失敗しました: {filename}")
+            
+            self.performance_monitor.end_timing('batch_excel_generation')
+            self.logger.info(f"バッチExcel生成完了: {len(generated_files)}/{len(case_list)}件")
+            return generated_files
+            
+        except Exception as e:
+            self.performance_monitor.end_timing('batch_excel_generation')
+            self.logger.error(f"バッチExcel生成エラー: {str(e)}")
+            raise
+
     def _get_output_path(self, output_filename: str) -> Path:
         """出力パスを取得"""
         output_path = self.output_dir / output_filename
@@ -684,6 +719,14 @@ class ExcelReportGeneratorOptimized:
 class TemplateManager:
     """Excelテンプレート管理クラス（最適化版）"""
     
+    # テンプレート種別とテンプレートファイル名の対応
+    TEMPLATE_FILES = {
+        "traffic_accident": "traffic_accident_template.xlsx",
+        "work_accident": "work_accident_template.xlsx", 
+        "medical_malpractice": "medical_malpractice_template.xlsx",
+        "default": "traffic_accident_template.xlsx"
+    }
+    
     def __init__(self, report_config: ReportConfig, error_handler: ErrorHandler):
         self.report_config = report_config
         self.error_handler = error_handler
@@ -826,15 +869,8 @@ class TemplateManager:
     @monitor_performance("template_application", track_parameters=True)
     def apply_template(self, template_name: str, case_data: CaseData) -> Optional[openpyxl.Workbook]:
         """テンプレートの適用"""
-        template_mapping = {
-            "traffic_accident": "traffic_accident_template.xlsx",
-            "work_accident": "work_accident_template.xlsx", 
-            "medical_malpractice": "medical_malpractice_template.xlsx",
-            "default": "traffic_accident_template.xlsx"
-        }
-        
-        template_filename = template_mapping.get(template_name, template_mapping["default"])
-        template_path = self.template_dir / template_filename
+        template_path = self.resolve_template_path(template_name)
+        template_filename = template_path.name
         
         try:
             if template_path.exists():
@@ -865,6 +901,11 @@ class TemplateManager:
             )
             return None
 
+    def resolve_template_path(self, template_name: str) -> Path:
+        """テンプレート種別に対応するテンプレートファイルのパスを取得（未知の種別は既定テンプレート）"""
+        template_filename = self.TEMPLATE_FILES.get(template_name, self.TEMPLATE_FILES["default"])
+        return self.template_dir / template_filename
+
     def _create_template_if_missing(self, template_name: str):
         """不足テンプレートの作成"""
         try:
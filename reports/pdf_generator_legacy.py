@@ -2,44 +2,360 @@
 # -*- coding: utf-8 -*-
 """
 PDFレポート生成モジュール
+
+ReportLab の platypus・pdfbase 等は読み込みに時間がかかるため、PDFを実際に生成するまで
+（PdfReportGenerator の初期化時まで）インポートを遅延する。
 """
 
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image # Image を追加
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT, TA_JUSTIFY
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-from reportlab.lib import colors
+from __future__ import annotations
+
+from reportlab.lib.units import mm # 単位定数のみの軽量モジュール
 from decimal import Decimal
 from datetime import datetime
 import traceback
 import os # os を追加
-
-# 日本語フォント対応のため追加
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
+import mmap
+import functools
+from itertools import chain
+from io import BytesIO
 
 from models.case_data import CaseData
 from calculation.compensation_engine import CalculationResult # CalculationResultをインポート
 from utils.error_handler import get_error_handler, CompensationSystemError, ErrorCategory, ErrorSeverity, FileIOError, ConfigurationError # ConfigurationError を追加
 from config.app_config import AppConfig # AppConfig をインポート
+from reports._fmt import format_yen as _yen, format_number as _num, format_percent as _pct, format_unit as _unit, format_grade as _grade
 import logging # 追加
+from typing import BinaryIO, Dict, List, Optional, Set, Tuple, Union
 
 # FONT_NAME_GOTHIC と FONT_FILE_PATH_GOTHIC のグローバル定義は削除し、configから取得する
 
+# ReportLab の遅延インポート済みフラグ（_import_reportlab でモジュールグローバルに名前を昇格させる）
+_LAZY_IMPORTED = False
+
+
+def _import_reportlab() -> None:
+    """ReportLab の各サブモジュールを初回のみインポートし、モジュールグローバルとして公開する"""
+    global _LAZY_IMPORTED, SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Flowable
+    global getSampleStyleSheet, ParagraphStyle, StyleSheet1, TA_LEFT, TA_CENTER, TA_RIGHT, A4, colors
+    global pdfmetrics, TTFont, ImageReader, _ResultsSummaryFlowable, _SharedImageFlowable
+    if _LAZY_IMPORTED:
+        return
+    from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Flowable
+    from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
+    from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib import colors
+    from reportlab.lib.utils import ImageReader
+    # 日本語フォント対応のため追加
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.ttfonts import TTFont
+    # Flowable の基底クラスもインポート後に確定させる
+    _ResultsSummaryFlowable = type('_ResultsSummaryFlowable', (_ResultsSummaryTable, Flowable), {})
+    _SharedImageFlowable = type('_SharedImageFlowable', (_SharedImage, Flowable), {})
+    _LAZY_IMPORTED = True
+
+
+# このプロセスで登録済みのフォント名（PdfReportGenerator インスタンス間で共有し、TTFの再解析を防ぐ）
+_REGISTERED_FONTS: Set[str] = set()
+
+
+class _MappedFontFile:
+    """TTFファイルをメモリマップで TTFont に渡すためのラッパー
+
+    ReportLab の TTFontParser は read() の戻り値をスライス・インデックス参照のみで扱うため、
+    bytes の代わりに mmap を返すことで大きなCJKフォントをヒープへ丸ごと読み込まずに済む。
+    mmap は登録されたフォントが参照し続けるため、プロセス終了まで有効なまま保持される。
+    """
+
+    def __init__(self, path: str, data: Union[mmap.mmap, bytes]):
+        self.name = path  # TTFontParser がエラーメッセージ用に参照する
+        self._data = data
+
+    def read(self) -> Union[mmap.mmap, bytes]:
+        return self._data
+
+    @classmethod
+    def open(cls, path: str) -> Union['_MappedFontFile', str]:
+        """フォントファイルをメモリマップする。マップできない場合はパスをそのまま返す"""
+        try:
+            with open(path, 'rb') as f:
+                return cls(path, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (OSError, ValueError):
+            return path
+
+
+@functools.lru_cache(maxsize=128)
+def _path_exists(path: str) -> bool:
+    """フォント・ロゴなど設定由来の静的ファイルの存在確認結果をプロセス内でキャッシュする
+
+    バッチ生成時にネットワークドライブ上のファイルへ毎回 stat() を発行しないためのもの。
+    出力ディレクトリのように実行中に作成されるパスには使わないこと。
+    """
+    return os.path.exists(path)
+
+
+# 計算結果表に表示する費目キーと表示順（キー→表示位置の辞書で O(1) の所属判定と並べ替えを行う）
+_ORDERED_RESULT_KEYS = (
+    'treatment_cost', 'hospital_miscellaneous_expenses', 'attendant_care_hospital',
+    'outpatient_transportation_fee', 'document_fee', 'lost_earning_due_to_absence',
+    'injury_compensation', 'disability_compensation', 'future_income_loss_disability',
+    'funeral_expenses', 'deceased_lost_income', 'deceased_compensation',
+    'survivor_compensation', 'property_damage', 'lawyer_fee'
+)
+_ORDERED_INDEX = {key: index for index, key in enumerate(_ORDERED_RESULT_KEYS)}
+
+def _calculate_fault_offset(total: Decimal, fault_percentage: float) -> Decimal:
+    """過失相殺額を円単位（偶数丸め）で計算する
+
+    合計額・過失割合がともに整数の場合（通常のケース）は整数演算のみで計算し、
+    それ以外は従来どおり Decimal で計算する。どちらも Decimal.quantize と同じ結果になる。
+    """
+    if total == total.to_integral_value() and float(fault_percentage).is_integer():
+        quotient, remainder = divmod(int(total) * int(fault_percentage), 100)
+        if remainder * 2 > 100 or (remainder * 2 == 100 and quotient % 2 == 1):
+            quotient += 1
+        return Decimal(quotient)
+    return (total * Decimal(fault_percentage) / Decimal(100)).quantize(Decimal('1'))
+
+
+def _cell(text: str, style: ParagraphStyle) -> Union[Paragraph, str]:
+    """マークアップを含む場合のみ Paragraph を作成し、それ以外は文字列のままテーブルセルに渡す
+
+    文字列セルのフォントはテーブルスタイルの FONTNAME/FONTSIZE で指定されている前提。
+    """
+    return Paragraph(text, style) if '<' in text else text
+
+
+class _ResultsSummaryTable:
+    """詳細列なし（費目・金額の2列固定幅）の計算結果表をキャンバスに直接描画するフロアブル
+
+    Table の列幅計算や Paragraph の組版を経由せず、行数 × 行高さで高さを確定して1行ずつ描画する。
+    rows は (費目名, 金額文字列, 種別) のタプルで、種別は 'item' / 'total' / 'offset' / 'final'。
+    見た目は _build_table_styles の 'results' による Table 描画に合わせている。
+    Flowable を継承した実体（_ResultsSummaryFlowable）は ReportLab の遅延インポート時に作成する。
+    """
+
+    ROW_HEIGHT = 17 # LEADING 11pt + 上下パディング 3pt
+    PADDING = 2*mm
+    HEADER_COLOR = "#4682B4"
+
+    def __init__(self, rows: List[Tuple[str, str, str]], font_name: str, col_widths: Tuple[float, float] = (60*mm, 40*mm)):
+        super().__init__()
+        self.hAlign = 'CENTER' # Table の既定配置に合わせる
+        self.rows = rows
+        self.font_name = font_name
+        try:
+            self.bold_font_name = pdfmetrics.getFont(font_name + '-Bold').fontName
+        except Exception: # 太字フォントがない場合（日本語TTFなど）は同じフォントを使う
+            self.bold_font_name = font_name
+        self.col_widths = col_widths
+        self.width = sum(col_widths)
+        self.height = (len(rows) + 1) * self.ROW_HEIGHT # +1 はヘッダー行
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canvas = self.canv
+        row_h = self.ROW_HEIGHT
+        pad = self.PADDING
+        name_w = self.col_widths[0]
+        width = self.width
+        height = self.height
+        text_offset = row_h / 2 + 3 # VALIGN MIDDLE 相当のベースライン位置（フォントサイズ9pt想定）
+
+        # ヘッダー行
+        canvas.setFillColor(colors.HexColor(self.HEADER_COLOR))
+        canvas.rect(0, height - row_h, width, row_h, stroke=0, fill=1)
+        canvas.setFillColor(colors.whitesmoke)
+        canvas.setFont(self.font_name, 10)
+        header_y = height - text_offset
+        canvas.drawCentredString(name_w / 2, header_y, "費目")
+        canvas.drawCentredString(name_w + self.col_widths[1] / 2, header_y, "金額（円）")
+
+        # データ行（フォント切り替えは太字行の前後のみ）
+        canvas.setFillColor(colors.black)
+        current_font = None
+        underlines = []
+        y = height - row_h - text_offset
+        for name, amount, kind in self.rows:
+            font = self.bold_font_name if kind in ('total', 'final') else self.font_name
+            if font != current_font:
+                canvas.setFont(font, 9)
+                current_font = font
+            canvas.drawString(pad, y, name)
+            canvas.drawRightString(width - pad, y, amount)
+            if kind == 'offset':
+                underlines.append((width - pad - canvas.stringWidth(amount, font, 9), y - 1.5, width - pad, y - 1.5))
+            y -= row_h
+
+        # 罫線はまとめて描画
+        canvas.setLineWidth(0.5)
+        canvas.setStrokeColor(colors.grey)
+        row_lines = [(0, height - i * row_h, width, height - i * row_h) for i in range(len(self.rows) + 2)]
+        column_lines = [(x, 0, x, height) for x in (0, name_w, width)]
+        canvas.lines(row_lines + column_lines)
+
+        canvas.setStrokeColor(colors.black)
+        if underlines:
+            canvas.lines(underlines)
+        # 最終合計行の上の線（二重線）と下線
+        canvas.setLineWidth(1)
+        canvas.lines([(0, row_h + 1, width, row_h + 1), (0, row_h - 1, width, row_h - 1)])
+        canvas.setLineWidth(0.5)
+        canvas.line(0, 0, width, 0)
+
+
+_ResultsSummaryFlowable = None # _import_reportlab で Flowable を継承したクラスに置き換える
+
+
+class _SharedImage:
+    """デコード済みの ImageReader をそのまま描画する画像フロアブル
+
+    platypus の Image はインスタンスごとに画像ファイルを開き直すため、ロゴのように全レポート共通の画像は
+    _load_logo で一度だけデコードした ImageReader をこのフロアブルで共有する。
+    Flowable を継承した実体（_SharedImageFlowable）は ReportLab の遅延インポート時に作成する。
+    """
+
+    def __init__(self, reader, width: float, height: float, hAlign: str = 'RIGHT'):
+        super().__init__()
+        self.reader = reader
+        self.width = width
+        self.height = height
+        self.hAlign = hAlign
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        self.canv.drawImage(self.reader, 0, 0, self.width, self.height, mask='auto')
+
+
+_SharedImageFlowable = None # _import_reportlab で Flowable を継承したクラスに置き換える
+
+
+@functools.lru_cache(maxsize=4)
+def _load_logo(path: str) -> Tuple[ImageReader, float, float]:
+    """ロゴ画像を一度だけデコードし、(ImageReader, 描画幅, 描画高さ) を返す（高さ15mm・縦横比維持）"""
+    from PIL import Image as PILImage # ReportLab の画像読み込みと同じく Pillow を使う
+    pil_image = PILImage.open(path)
+    pil_image.load() # ここでデコードを済ませ、以降のレポートでは再デコードしない
+    reader = ImageReader(pil_image)
+    image_width, image_height = reader.getSize()
+    draw_height = 15*mm # 高さを指定 (幅は自動調整)
+    return reader, (draw_height / image_height) * image_width, draw_height # アスペクト比を維持
+
+
+@functools.lru_cache(maxsize=4)
+def _build_styles(base_font: str) -> StyleSheet1:
+    """フォント名ごとにカスタムスタイルを含むスタイルシートを一度だけ作成する
+
+    戻り値は同じフォントを使う全インスタンスで共有されるため、呼び出し側で変更しないこと。
+    """
+    styles = getSampleStyleSheet()
+    styles.add(ParagraphStyle(name='MainTitle', fontSize=18, alignment=TA_CENTER, spaceAfter=10*mm, fontName=base_font, leading=22))
+    styles.add(ParagraphStyle(name='SubTitle', fontSize=14, alignment=TA_LEFT, spaceAfter=5*mm, spaceBefore=5*mm, fontName=base_font, leading=18))
+    # 'Normal' はサンプルスタイルシートに定義済みのため add せずに上書きする
+    normal = styles['Normal']
+    normal.fontSize, normal.alignment, normal.fontName, normal.leading = 10, TA_LEFT, base_font, 14
+    styles.add(ParagraphStyle(name='NormalCenter', parent=normal, alignment=TA_CENTER))
+    styles.add(ParagraphStyle(name='TableHeader', fontSize=10, alignment=TA_CENTER, fontName=base_font, textColor=colors.whitesmoke, leading=12))
+    styles.add(ParagraphStyle(name='TableCell', fontSize=9, alignment=TA_LEFT, fontName=base_font, leading=11))
+    styles.add(ParagraphStyle(name='TableCellRight', fontSize=9, alignment=TA_RIGHT, fontName=base_font, leading=11))
+    styles.add(ParagraphStyle(name='Footer', fontSize=8, alignment=TA_CENTER, fontName=base_font, leading=10))
+    styles.add(ParagraphStyle(name='SmallText', fontSize=8, alignment=TA_LEFT, fontName=base_font, leading=10))
+    return styles
+
+
+@functools.lru_cache(maxsize=4)
+def _build_table_styles(base_font: str) -> Dict[str, TableStyle]:
+    """ベースフォントごとのテーブルスタイルを生成する（同一フォントのインスタンス間で共有）
+
+    マークアップを含まないセルは Paragraph を使わず文字列のまま渡すため、フォントはテーブル側で指定する。
+    Table.setStyle はスタイルを読み取るだけなので、生成済みの TableStyle を使い回しても安全。
+    """
+    header_commands = (
+        ('VALIGN', (0,0), (-1,-1), 'TOP'),
+        ('LEFTPADDING', (0,0), (-1,-1), 0),
+        ('BOTTOMPADDING', (0,0), (-1,-1), 1*mm),
+    )
+    info_commands = (
+        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
+        ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
+    )
+    medical_commands = info_commands + (
+        ('SPAN', (1,6), (-1,6)), # 後遺障害詳細のセルを結合
+    )
+    results_commands = (
+        ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
+        ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4682B4")), # ヘッダー背景色 (SteelBlue)
+        ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
+        ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
+        ('ALIGN', (1,0), (1,-1), 'RIGHT'), # 金額列は右寄せ
+        ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
+        ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
+        ('LINEBELOW', (0,-2), (-1,-2), 1, colors.black), # 最終合計の上の線
+        ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black, None, None, None, 2, 1), # 最終合計の上の二重線 (線数2・間隔1pt)
+        ('LINEBELOW', (0, -1), (-1, -1), 0.5, colors.black), # 最終合計の下線
+    )
+    normal_cell_font = (
+        ('FONTNAME', (0,0), (-1,-1), base_font),
+        ('FONTSIZE', (0,0), (-1,-1), 10),
+        ('LEADING', (0,0), (-1,-1), 14),
+    )
+    table_cell_font = (
+        ('FONTNAME', (0,0), (-1,-1), base_font),
+        ('FONTSIZE', (0,0), (-1,-1), 9),
+        ('LEADING', (0,0), (-1,-1), 11),
+    )
+    return {
+        'header': TableStyle(header_commands + normal_cell_font),
+        'basic': TableStyle(info_commands + table_cell_font + (
+            ('ALIGN', (1,4), (1,5), 'RIGHT'), # 事故前年収・過失割合
+        )),
+        'medical': TableStyle(medical_commands + table_cell_font),
+        'income': TableStyle(info_commands + table_cell_font + (
+            ('ALIGN', (1,1), (1,2), 'RIGHT'), # 日額基礎収入・基礎年収
+        )),
+        'results': TableStyle(results_commands + table_cell_font),
+    }
+
+
 class PdfReportGenerator:
     """PDFレポート生成クラス"""
 
-    def __init__(self, config: AppConfig, case_data: CaseData, calculation_results: dict[str, CalculationResult]): # config を追加
+    def __init__(self, config: AppConfig, case_data: Optional[CaseData] = None,
+                 calculation_results: Optional[dict[str, CalculationResult]] = None,
+                 created_at: Optional[datetime] = None): # config を追加
+        """案件データは省略可能。省略した場合は emit() で案件ごとに渡す
+
+        フォント登録・スタイル・テーブルスタイルはインスタンス単位で一度だけ準備されるため、
+        複数案件を出力する場合は1つのインスタンスで emit() を繰り返し呼ぶ。
+        """
+        _import_reportlab() # PDF生成に必要な ReportLab をここで初めて読み込む
         self.config = config
+        # 作成日はインスタンス生成時に一度だけ整形し、バッチ生成では全レポートで共有する
+        self.created_at = created_at or datetime.now()
+        self._created_str = self.created_at.strftime("%Y年%m月%d日")
         self.report_config = config.report
-        self.case_data = case_data
-        self.calculation_results = calculation_results
-        self.styles = getSampleStyleSheet()
+        self._set_case(case_data, calculation_results if calculation_results is not None else {})
+        self.styles = None # custom_styles で _build_styles の共有スタイルシートを設定する
+        self.table_styles = None # custom_styles で _build_table_styles の共有テーブルスタイルを設定する
         self.error_handler = get_error_handler()
         self.logger = logging.getLogger(__name__)
+        # フォント登録（TTF解析）とスタイル定義は初回の generate_report まで遅延する
+        self._fonts_ready = False
+        self._static_flowables_cache: Optional[Dict[str, Paragraph]] = None
+
+    def _ensure_fonts_ready(self):
+        """フォント登録とカスタムスタイル定義を初回のみ実行する"""
+        if self._fonts_ready:
+            return
         self._register_fonts() # フォント登録処理をメソッド化
         self.custom_styles()
+        self._fonts_ready = True
 
     def _register_fonts(self):
         """設定に基づいてフォントを登録する"""
@@ -60,9 +376,16 @@ class PdfReportGenerator:
             self.logger.error("ゴシックフォントの設定が不完全なため、PDF生成に問題が発生する可能性があります。")
             return # フォント登録をスキップ
 
+        if font_name_gothic in _REGISTERED_FONTS or font_name_gothic in pdfmetrics.getRegisteredFontNames():
+            # 同一プロセス内で登録済み（別インスタンスや別モジュール）の場合はTTFの再解析を省略
+            _REGISTERED_FONTS.add(font_name_gothic)
+            self.logger.debug(f"フォント '{font_name_gothic}' は登録済みのため再登録を省略します。")
+            return
+
         try:
-            if os.path.exists(font_path_gothic):
-                pdfmetrics.registerFont(TTFont(font_name_gothic, font_path_gothic))
+            if _path_exists(font_path_gothic):
+                pdfmetrics.registerFont(TTFont(font_name_gothic, _MappedFontFile.open(font_path_gothic)))
+                _REGISTERED_FONTS.add(font_name_gothic)
                 self.logger.info(f"フォント '{font_name_gothic}' を '{font_path_gothic}' から登録しました。")
             else:
                 self.error_handler.handle_exception(
@@ -90,269 +413,293 @@ class PdfReportGenerator:
         """カスタムスタイルの定義"""
         font_name_gothic = self.report_config.font_name_gothic
         # フォントが正常に登録されたか確認し、されていなければデフォルトフォントを使用
-        base_font = font_name_gothic if pdfmetrics.getFont(font_name_gothic, None) else 'Helvetica'
+        # （getFont は未登録時に例外を送出するため、登録済みフォント名の一覧で判定する）
+        has_gothic_font = bool(font_name_gothic) and font_name_gothic in pdfmetrics.getRegisteredFontNames()
+        base_font = font_name_gothic if has_gothic_font else 'Helvetica'
         
         if base_font == 'Helvetica' and font_name_gothic:
             self.logger.warning(f"指定されたフォント '{font_name_gothic}' が利用できないため、Helveticaにフォールバックします。")
 
+        self.styles = _build_styles(base_font)
+
+        self.table_styles = _build_table_styles(base_font)
+
+    def generate_report(self, output_filename: Union[str, BinaryIO], output_dir: Optional[str] = None,
+                        output_stream: Optional[BinaryIO] = None): # 引数を output_filename に変更
+        """PDFレポートを生成し、成功時は出力先（ファイルパスまたは渡されたストリーム）を返す
+
+        output_stream（または write() を持つ output_filename）を渡した場合はファイルを開かずにそのまま書き込む。
+        この場合 output_filename はログ表示用の名前としてのみ使われる。
+        """
+        self._ensure_fonts_ready()
+        if output_stream is None and hasattr(output_filename, 'write'):
+            output_stream, output_filename = output_filename, "<buffer>"
+        if output_stream is not None:
+            return output_stream if self._build_pdf(output_stream, str(output_filename or "<stream>")) else None
+
+        output_dir = output_dir or self.report_config.default_output_directory
+        try:
+            # 存在確認と作成を1回の呼び出しで行う（既存の場合は何もしない）
+            os.makedirs(output_dir, exist_ok=True)
+        except OSError as e:
+            self.error_handler.handle_exception(
+                FileIOError(
+                    f"出力ディレクトリ '{output_dir}' の作成に失敗しました: {e}",
+                    user_message=f"レポートの出力先ディレクトリ '{output_dir}' を作成できませんでした。権限などを確認してください。",
+                    severity=ErrorSeverity.HIGH,
+                    context={"path": output_dir, "exception": str(e)}
+                )
+            )
+            return # ディレクトリ作成失敗時は処理を中断
+
+        filepath = os.path.join(output_dir, output_filename)
+        # メモリ上に生成し、成功した場合のみ書き出す（失敗時に空・途中のPDFを残したり既存のレポートを消したりしない）
+        buffer = BytesIO()
+        if not self._build_pdf(buffer, filepath):
+            return None
+        try:
+            with open(filepath, 'wb') as output:
+                output.write(buffer.getbuffer())
+        except OSError as e:
+            self.error_handler.handle_exception(
+                FileIOError(
+                    f"PDFファイル '{filepath}' を開けませんでした: {e}",
+                    user_message=f"PDFファイル '{filepath}' に書き込めませんでした。権限やファイルの使用状況を確認してください。",
+                    severity=ErrorSeverity.HIGH,
+                    context={"filepath": filepath, "exception": str(e)}
+                )
+            )
+            return None
+        return filepath
+
+    def emit(self, case_data: CaseData, calculation_results: Dict[str, CalculationResult],
+             output_filename: Union[str, BinaryIO], output_dir: Optional[str] = None):
+        """指定した案件のPDFレポートを生成する（フォント・スタイルはこのインスタンスのものを再利用）
+
+        渡した案件データ・計算結果は以降このインスタンスの現在の案件となる。戻り値は generate_report と同じ。
+        """
+        self._set_case(case_data, calculation_results)
+        return self.generate_report(output_filename, output_dir)
+
+    def _set_case(self, case_data: Optional[CaseData], calculation_results: Dict[str, CalculationResult]):
+        """現在の案件を設定する。CalculationResult 以外の値は従来どおり集計・表示の対象外とし、
+        行ごとではなくここで一度だけ除外する"""
+        self.case_data = case_data
+        self.calculation_results = {
+            key: result for key, result in calculation_results.items()
+            if isinstance(result, CalculationResult)
+        }
+
+    def generate_to_bytes(self) -> Optional[bytes]:
+        """PDFレポートをメモリ上に生成してバイト列で返す（失敗時はNone）"""
+        buffer = BytesIO()
+        if self.generate_report("<bytes>", output_stream=buffer) is None:
+            return None
+        return buffer.getvalue()
 
-        self.styles.add(ParagraphStyle(name='MainTitle', fontSize=18, alignment=TA_CENTER, spaceAfter=10*mm, fontName=base_font, leading=22))
-        self.styles.add(ParagraphStyle(name='SubTitle', fontSize=14, alignment=TA_LEFT, spaceAfter=5*mm, spaceBefore=5*mm, fontName=base_font, leading=18))
-        self.styles.add(ParagraphStyle(name='Normal', fontSize=10, alignment=TA_LEFT, fontName=base_font, leading=14))
-        self.styles.add(ParagraphStyle(name='NormalRight', fontSize=10, alignment=TA_RIGHT, fontName=base_font, leading=14))
-        self.styles.add(ParagraphStyle(name='NormalJustify', fontSize=10, alignment=TA_JUSTIFY, leading=14, fontName=base_font))
-        self.styles.add(ParagraphStyle(name='TableHeader', fontSize=10, alignment=TA_CENTER, fontName=base_font, textColor=colors.whitesmoke, leading=12))
-        self.styles.add(ParagraphStyle(name='TableCell', fontSize=9, alignment=TA_LEFT, fontName=base_font, leading=11))
-        self.styles.add(ParagraphStyle(name='TableCellRight', fontSize=9, alignment=TA_RIGHT, fontName=base_font, leading=11))
-        self.styles.add(ParagraphStyle(name='Footer', fontSize=8, alignment=TA_CENTER, fontName=base_font, leading=10))
-        self.styles.add(ParagraphStyle(name='SmallText', fontSize=8, alignment=TA_LEFT, fontName=base_font, leading=10))
-
-    def generate_report(self, output_filename: str): # 引数を output_filename に変更
-        """PDFレポートを生成"""
-        output_dir = self.report_config.default_output_directory
-        if not os.path.exists(output_dir):
+    def _static_flowables(self) -> Dict[str, Paragraph]:
+        """案件に依存しない見出し・免責事項の Paragraph を返す（初回生成後はインスタンス内で使い回す）"""
+        if self._static_flowables_cache is None:
+            disclaimer = "この計算書は、提供された情報に基づいて作成された概算であり、法的な助言や最終的な賠償金額を保証するものではありません。具体的な事案については、弁護士にご相談ください。"
+            self._static_flowables_cache = {
+                'title': Paragraph("損害賠償額計算書", self.styles['MainTitle']),
+                'basic_heading': Paragraph("1. 基本情報", self.styles['SubTitle']),
+                'medical_heading': Paragraph("2. 医療情報", self.styles['SubTitle']),
+                'income_heading': Paragraph("3. 収入・損害情報", self.styles['SubTitle']),
+                'results_heading': Paragraph("4. 損害賠償額計算結果", self.styles['SubTitle']),
+                'separator': Paragraph("---", self.styles['NormalCenter']),
+                'disclaimer': Paragraph(disclaimer, self.styles['SmallText']),
+            }
+        return self._static_flowables_cache
+
+    def _build_story(self) -> list:
+        """現在の案件データと計算結果からストーリー（フロアブルのリスト）を組み立てる"""
+        static = self._static_flowables()
+        table_cell = self.styles['TableCell']
+
+        # 各セクションのフロアブルを先に組み立て、最後に1つのリストリテラルで story を作る
+        # 0. 会社ロゴ (設定されていれば)
+        logo_section = ()
+        if self.report_config.company_logo_path and _path_exists(self.report_config.company_logo_path):
             try:
-                os.makedirs(output_dir)
-                self.logger.info(f"出力ディレクトリ '{output_dir}' を作成しました。")
-            except OSError as e:
+                # デコード済みのロゴ画像と描画サイズはプロセス内で共有する
+                logo_reader, logo_width, logo_height = _load_logo(self.report_config.company_logo_path)
+                logo = _SharedImageFlowable(logo_reader, logo_width, logo_height, hAlign='RIGHT') # 右寄せ
+                logo_section = (logo, Spacer(1, 5*mm))
+            except Exception as e:
                 self.error_handler.handle_exception(
                     FileIOError(
-                        f"出力ディレクトリ '{output_dir}' の作成に失敗しました: {e}",
-                        user_message=f"レポートの出力先ディレクトリ '{output_dir}' を作成できませんでした。権限などを確認してください。",
-                        severity=ErrorSeverity.HIGH,
-                        context={"path": output_dir, "exception": str(e)}
+                        f"会社ロゴファイル '{self.report_config.company_logo_path}' の読み込みまたは処理に失敗しました: {e}",
+                        user_message="会社ロゴの表示に失敗しました。ロゴファイルパスやファイル形式を確認してください。",
+                        severity=ErrorSeverity.WARNING, # ロゴは警告レベル
+                        context={"logo_path": self.report_config.company_logo_path, "exception": str(e)}
                     )
                 )
-                return # ディレクトリ作成失敗時は処理を中断
+                self.logger.warning(f"会社ロゴの読み込みに失敗: {self.report_config.company_logo_path}, エラー: {e}")
+        elif self.report_config.company_logo_path: # パスは指定されているが存在しない場合
+             self.logger.warning(f"会社ロゴファイルが見つかりません: {self.report_config.company_logo_path}")
+
+
+        # 1. ヘッダー情報
+        header_data = [
+            ["案件番号:", str(self.case_data.case_number or '未設定')],
+            ["依頼者名:", str(self.case_data.person_info.name or '未設定')],
+            ["作成日:", self._created_str],
+            ["作成者:", self.report_config.default_author or '未設定'], # 作成者情報を追加
+        ]
+        header_table = Table(header_data, colWidths=[40*mm, None])
+        header_table.setStyle(self.table_styles['header'])
+
+        # 2. 基本情報
+        basic_info_data = [
+            ["事故発生日:", str(self.case_data.accident_info.accident_date or '-')],
+            ["被害者年齢（事故時）:", _unit(self.case_data.person_info.age, "歳") if self.case_data.person_info.age is not None else '-'],
+            ["性別:", str(self.case_data.person_info.gender or '-')],
+            ["職業:", str(self.case_data.person_info.occupation or '-')],
+            ["事故前年収:", _yen(round(self.case_data.person_info.annual_income)) if self.case_data.person_info.annual_income is not None else '-'],
+            ["被害者過失割合:", f"{_pct(self.case_data.person_info.fault_percentage or 0)} %"],
+        ]
+        basic_table = Table(basic_info_data, colWidths=[50*mm, None])
+        basic_table.setStyle(self.table_styles['basic'])
+
+        # 3. 医療情報
+        med_info = self.case_data.medical_info
+        medical_info_data = [
+            ["症状固定日:", str(self.case_data.accident_info.symptom_fixed_date or '-')],
+            ["入院期間:", _unit(med_info.hospital_months, "ヶ月") if med_info.hospital_months is not None else '-'],
+            ["通院期間:", _unit(med_info.outpatient_months, "ヶ月") if med_info.outpatient_months is not None else '-'],
+            ["実通院日数:", _unit(med_info.actual_outpatient_days, "日") if med_info.actual_outpatient_days is not None else '-'],
+            ["むちうち等:", "該当" if med_info.is_whiplash else "非該当"],
+            ["後遺障害等級:", _grade(med_info.disability_grade) if med_info.disability_grade and med_info.disability_grade > 0 else "なし"],
+            ["後遺障害詳細:", Paragraph(med_info.disability_details or '-', table_cell)], # 長文になり得るため折り返し可能なParagraphのまま
+        ]
+        medical_table = Table(medical_info_data, colWidths=[50*mm, None])
+        medical_table.setStyle(self.table_styles['medical'])
+
+        # 4. 収入・損害情報 (逸失利益関連)
+        inc_info = self.case_data.income_info
+        income_info_data = [
+            ["休業日数:", _unit(inc_info.lost_work_days, "日") if inc_info.lost_work_days is not None else '-'],
+            ["日額基礎収入:", _yen(round(inc_info.daily_income)) if inc_info.daily_income is not None else '-'],
+            ["基礎年収（逸失利益用）:", _yen(round(inc_info.base_annual_income)) if inc_info.base_annual_income is not None else '-'],
+            ["労働能力喪失期間:", _unit(inc_info.loss_period_years, "年") if inc_info.loss_period_years is not None else '-'],
+            ["就労可能年数上限:", _unit(self.case_data.person_info.retirement_age, "歳") if self.case_data.person_info.retirement_age is not None else '-'],
+        ]
+        income_table = Table(income_info_data, colWidths=[50*mm, None])
+        income_table.setStyle(self.table_styles['income'])
+
+        # 5. 計算結果
+        # CalculationResult 以外の値は _set_case で除外済み
+        result_items = self.calculation_results.items()
+        # _ORDERED_INDEX にあり金額が0より大きいものだけを表示順に並べて表示し、ないものは合計にのみ加算
+        displayed_items = [(key, result) for key, result in result_items if key in _ORDERED_INDEX and result.amount > 0]
+        displayed_items.sort(key=lambda item: _ORDERED_INDEX[item[0]])
+        displayed_results = [result for _, result in displayed_items]
+        unlisted_results = [result for key, result in result_items if key not in _ORDERED_INDEX]
+        if unlisted_results and self.logger.isEnabledFor(logging.DEBUG):
+            unlisted_keys = [key for key, _ in result_items if key not in _ORDERED_INDEX]
+            self.logger.debug(f"Calculation results {unlisted_keys} are not in the display order, skipping direct display.")
+        grand_total_before_fault_offset = sum(
+            (result.amount for result in chain(displayed_results, unlisted_results)), Decimal(0)
+        )
+        grand_total_str = _num(round(grand_total_before_fault_offset))
+
+        # 過失相殺
+        fault_percentage = self.case_data.person_info.fault_percentage or 0
+        fault_percentage_str = _pct(fault_percentage)
+        fault_offset_amount = _calculate_fault_offset(grand_total_before_fault_offset, fault_percentage)
+        offset_amount_str = f"-{_num(round(fault_offset_amount))}"
+        final_total_str = _num(round(grand_total_before_fault_offset - fault_offset_amount))
+
+        if not self.report_config.include_detailed_calculation_in_pdf:
+            # 詳細列なしの2列固定幅の表は Table を使わずキャンバスに直接描画する
+            summary_rows = [(result.item_name, _num(result.amount_int), 'item') for result in displayed_results]
+            summary_rows.append(("合計（過失相殺前）", grand_total_str, 'total'))
+            summary_rows.append((f"過失相殺（{fault_percentage_str}%）", offset_amount_str, 'offset'))
+            summary_rows.append(("最終合計金額", final_total_str, 'final'))
+            results_table = _ResultsSummaryFlowable(summary_rows, table_cell.fontName)
+        else:
+            results_table = self._build_detailed_results_table(
+                displayed_results, grand_total_str, fault_percentage_str, offset_amount_str, final_total_str
+            )
 
-        filepath = os.path.join(output_dir, output_filename)
-        
-        doc = SimpleDocTemplate(filepath, pagesize=A4,
+        return [
+            *logo_section,
+            static['title'], Spacer(1, 5*mm),
+            header_table, Spacer(1, 10*mm),
+            static['basic_heading'], basic_table, Spacer(1, 7*mm),
+            static['medical_heading'], medical_table, Spacer(1, 7*mm),
+            static['income_heading'], income_table, Spacer(1, 10*mm),
+            PageBreak(), # 計算結果は新しいページから
+            static['results_heading'], results_table, Spacer(1, 10*mm),
+            # 6. フッター (免責事項など)
+            static['separator'], Spacer(1, 2*mm), static['disclaimer'],
+        ]
+
+    def _build_detailed_results_table(self, displayed_results: List[CalculationResult], grand_total_str: str,
+                                      fault_percentage_str: str, offset_amount_str: str, final_total_str: str) -> Table:
+        """計算根拠・備考列を含む3列の計算結果テーブルを作成する"""
+        # 行構築で繰り返し参照するスタイルはローカル変数に束縛しておく
+        table_cell = self.styles['TableCell']
+        table_cell_right = self.styles['TableCellRight']
+        table_header = self.styles['TableHeader']
+        results_header = [
+            Paragraph("<b>費目</b>", table_header),
+            Paragraph("<b>金額（円）</b>", table_header),
+            Paragraph("<b>計算根拠・備考</b>", table_header),
+        ]
+        results_data = [results_header]
+
+        # 費目名・金額はマークアップを含まないため文字列のままセルに渡す（フォントはテーブルスタイルで指定）
+        # 計算根拠・法的根拠・備考のHTMLは CalculationResult 側でキャッシュされる
+        item_names = [result.item_name for result in displayed_results]
+        amount_strs = [_num(result.amount_int) for result in displayed_results]
+        # 計算根拠がない行（"-"）は Paragraph の解析を省いて文字列のまま渡す
+        details_paragraphs = [html if html == "-" else Paragraph(html, table_cell)
+                              for html in [result.html_details for result in displayed_results]]
+        results_data.extend(map(list, zip(item_names, amount_strs, details_paragraphs)))
+
+        # 「合計（過失相殺前）」「過失相殺」「最終合計金額」の行を追加
+        results_data.append([
+            Paragraph("<b>合計（過失相殺前）</b>", table_cell),
+            Paragraph(f"<b>{grand_total_str}</b>", table_cell_right),
+            "", # 備考欄は空
+        ])
+        results_data.append([
+            _cell(f"過失相殺（{fault_percentage_str}%）", table_cell),
+            Paragraph(f"<u>{offset_amount_str}</u>", table_cell_right), # 下線を追加
+            _cell(f"{grand_total_str}円 × {fault_percentage_str}%", table_cell),
+        ])
+        results_data.append([
+            Paragraph("<b>最終合計金額</b>", table_cell), # 太字に変更
+            Paragraph(f"<b>{final_total_str}</b>", table_cell_right), # 太字に変更
+            "", # 備考欄は空
+        ])
+
+        # テーブルスタイル
+        col_widths = [60*mm, 40*mm, None] # 備考欄の幅は残り全て
+
+        results_table = Table(results_data, colWidths=col_widths)
+        # 最終行のフォントを太字にするスタイル (Paragraph内で<b>タグを使っているので不要かもしれないが念のため)
+        # ('FONTNAME', (0, -1), (-1, -1), self.styles['TableCell'].fontName + '-Bold') はうまく動かない場合がある
+        results_table.setStyle(self.table_styles['results'])
+        return results_table
+
+    def _build_pdf(self, output: BinaryIO, filepath: str) -> bool:
+        """ストーリーを組み立てて output に書き込む。filepath はログ表示用"""
+        doc = SimpleDocTemplate(output, pagesize=A4,
                                 topMargin=20*mm, bottomMargin=20*mm,
                                 leftMargin=20*mm, rightMargin=20*mm,
+                                pageCompression=1, # コンテンツストリームをzlib圧縮して出力サイズを抑える
                                 author=self.report_config.default_author, #作成者を設定
                                 title=f"損害賠償額計算書 - {self.case_data.case_number or 'N/A'}" # タイトルも設定
                                 )
         
-        story = []
-
         try:
-            # 0. 会社ロゴ (設定されていれば)
-            if self.report_config.company_logo_path and os.path.exists(self.report_config.company_logo_path):
-                try:
-                    logo = Image(self.report_config.company_logo_path)
-                    logo.drawHeight = 15*mm # 高さを指定 (幅は自動調整)
-                    logo.drawWidth = (logo.drawHeight / logo.imageHeight) * logo.imageWidth # アスペクト比を維持
-                    logo.hAlign = 'RIGHT' # 右寄せ
-                    story.append(logo)
-                    story.append(Spacer(1, 5*mm))
-                except Exception as e:
-                    self.error_handler.handle_exception(
-                        FileIOError(
-                            f"会社ロゴファイル '{self.report_config.company_logo_path}' の読み込みまたは処理に失敗しました: {e}",
-                            user_message="会社ロゴの表示に失敗しました。ロゴファイルパスやファイル形式を確認してください。",
-                            severity=ErrorSeverity.WARNING, # ロゴは警告レベル
-                            context={"logo_path": self.report_config.company_logo_path, "exception": str(e)}
-                        )
-                    )
-                    self.logger.warning(f"会社ロゴの読み込みに失敗: {self.report_config.company_logo_path}, エラー: {e}")
-            elif self.report_config.company_logo_path: # パスは指定されているが存在しない場合
-                 self.logger.warning(f"会社ロゴファイルが見つかりません: {self.report_config.company_logo_path}")
-
-
-            # 1. ヘッダー情報
-            story.append(Paragraph("損害賠償額計算書", self.styles['MainTitle']))
-            story.append(Spacer(1, 5*mm))
-            
-            header_data = [
-                [Paragraph("案件番号:", self.styles['Normal']), Paragraph(str(self.case_data.case_number or '未設定'), self.styles['Normal'])],
-                [Paragraph("依頼者名:", self.styles['Normal']), Paragraph(str(self.case_data.person_info.name or '未設定'), self.styles['Normal'])],
-                [Paragraph("作成日:", self.styles['Normal']), Paragraph(datetime.now().strftime("%Y年%m月%d日"), self.styles['Normal'])],
-                [Paragraph("作成者:", self.styles['Normal']), Paragraph(self.report_config.default_author or '未設定', self.styles['Normal'])], # 作成者情報を追加
-            ]
-            header_table = Table(header_data, colWidths=[40*mm, None])
-            header_table.setStyle(TableStyle([
-                ('VALIGN', (0,0), (-1,-1), 'TOP'),
-                ('LEFTPADDING', (0,0), (-1,-1), 0),
-                ('BOTTOMPADDING', (0,0), (-1,-1), 1*mm),
-            ]))
-            story.append(header_table)
-            story.append(Spacer(1, 10*mm))
-
-            # 2. 基本情報
-            story.append(Paragraph("1. 基本情報", self.styles['SubTitle']))
-            basic_info_data = [
-                [Paragraph("事故発生日:", self.styles['TableCell']), Paragraph(str(self.case_data.accident_info.accident_date or '-'), self.styles['TableCell'])],
-                [Paragraph(f"被害者年齢（事故時）:", self.styles['TableCell']), Paragraph(f"{self.case_data.person_info.age} 歳" if self.case_data.person_info.age is not None else '-', self.styles['TableCell'])],
-                [Paragraph("性別:", self.styles['TableCell']), Paragraph(str(self.case_data.person_info.gender or '-'), self.styles['TableCell'])],
-                [Paragraph("職業:", self.styles['TableCell']), Paragraph(str(self.case_data.person_info.occupation or '-'), self.styles['TableCell'])],
-                [Paragraph("事故前年収:", self.styles['TableCell']), Paragraph(f"{self.case_data.person_info.annual_income:,.0f} 円" if self.case_data.person_info.annual_income is not None else '-', self.styles['TableCellRight'])],
-                [Paragraph("被害者過失割合:", self.styles['TableCell']), Paragraph(f"{self.case_data.person_info.fault_percentage or 0} %", self.styles['TableCellRight'])],
-            ]
-            basic_table = Table(basic_info_data, colWidths=[50*mm, None])
-            basic_table.setStyle(TableStyle([
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
-                ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
-            ]))
-            story.append(basic_table)
-            story.append(Spacer(1, 7*mm))
-
-            # 3. 医療情報
-            story.append(Paragraph("2. 医療情報", self.styles['SubTitle']))
-            med_info = self.case_data.medical_info
-            medical_info_data = [
-                [Paragraph("症状固定日:", self.styles['TableCell']), Paragraph(str(self.case_data.accident_info.symptom_fixed_date or '-'), self.styles['TableCell'])],
-                [Paragraph("入院期間:", self.styles['TableCell']), Paragraph(f"{med_info.hospital_months} ヶ月" if med_info.hospital_months is not None else '-', self.styles['TableCell'])],
-                [Paragraph("通院期間:", self.styles['TableCell']), Paragraph(f"{med_info.outpatient_months} ヶ月" if med_info.outpatient_months is not None else '-', self.styles['TableCell'])],
-                [Paragraph("実通院日数:", self.styles['TableCell']), Paragraph(f"{med_info.actual_outpatient_days} 日" if med_info.actual_outpatient_days is not None else '-', self.styles['TableCell'])],
-                [Paragraph("むちうち等:", self.styles['TableCell']), Paragraph("該当" if med_info.is_whiplash else "非該当", self.styles['TableCell'])],
-                [Paragraph("後遺障害等級:", self.styles['TableCell']), Paragraph(f"第 {med_info.disability_grade} 級" if med_info.disability_grade and med_info.disability_grade > 0 else "なし", self.styles['TableCell'])],
-                [Paragraph("後遺障害詳細:", self.styles['TableCell']), Paragraph(med_info.disability_details or '-', self.styles['TableCell'])],
-            ]
-            medical_table = Table(medical_info_data, colWidths=[50*mm, None])
-            medical_table.setStyle(TableStyle([
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
-                ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
-                ('SPAN', (1,6), (-1,6)) # 後遺障害詳細のセルを結合
-            ]))
-            story.append(medical_table)
-            story.append(Spacer(1, 7*mm))
-
-            # 4. 収入・損害情報 (逸失利益関連)
-            story.append(Paragraph("3. 収入・損害情報", self.styles['SubTitle']))
-            inc_info = self.case_data.income_info
-            income_info_data = [
-                [Paragraph("休業日数:", self.styles['TableCell']), Paragraph(f"{inc_info.lost_work_days} 日" if inc_info.lost_work_days is not None else '-', self.styles['TableCell'])],
-                [Paragraph("日額基礎収入:", self.styles['TableCell']), Paragraph(f"{inc_info.daily_income:,.0f} 円" if inc_info.daily_income is not None else '-', self.styles['TableCellRight'])],
-                [Paragraph("基礎年収（逸失利益用）:", self.styles['TableCell']), Paragraph(f"{inc_info.base_annual_income:,.0f} 円" if inc_info.base_annual_income is not None else '-', self.styles['TableCellRight'])],
-                [Paragraph("労働能力喪失期間:", self.styles['TableCell']), Paragraph(f"{inc_info.loss_period_years} 年" if inc_info.loss_period_years is not None else '-', self.styles['TableCell'])],
-                [Paragraph("就労可能年数上限:", self.styles['TableCell']), Paragraph(f"{self.case_data.person_info.retirement_age} 歳" if self.case_data.person_info.retirement_age is not None else '-', self.styles['TableCell'])],
-            ]
-            income_table = Table(income_info_data, colWidths=[50*mm, None])
-            income_table.setStyle(TableStyle([
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
-                ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
-            ]))
-            story.append(income_table)
-            story.append(Spacer(1, 10*mm))
-            
-            story.append(PageBreak()) # 計算結果は新しいページから
-
-            # 5. 計算結果
-            story.append(Paragraph("4. 損害賠償額計算結果", self.styles['SubTitle']))
-            
-            results_header = [
-                Paragraph("<b>費目</b>", self.styles['TableHeader']),
-                Paragraph("<b>金額（円）</b>", self.styles['TableHeader']),
-            ]
-            if self.report_config.include_detailed_calculation_in_pdf: # 詳細表示フラグを確認
-                results_header.append(Paragraph("<b>計算根拠・備考</b>", self.styles['TableHeader']))
-            
-            results_data = [results_header]
-            
-            ordered_items = [
-                'treatment_cost', 'hospital_miscellaneous_expenses', 'attendant_care_hospital',
-                'outpatient_transportation_fee', 'document_fee', 'lost_earning_due_to_absence',
-                'injury_compensation', 'disability_compensation', 'future_income_loss_disability',
-                'funeral_expenses', 'deceased_lost_income', 'deceased_compensation',
-                'survivor_compensation', 'property_damage', 'lawyer_fee'
-            ]
-
-            total_amount = Decimal(0)
-            grand_total_before_fault_offset = Decimal(0)
-
-            for key, result in self.calculation_results.items():
-                if key not in ordered_items: # ordered_items にないものはその他として扱うか、ログを出す
-                    self.logger.debug(f"Calculation result for '{key}' is not in ordered_items, skipping direct display.")
-                    if isinstance(result, CalculationResult): # CalculationResult インスタンスのみ集計対象
-                         grand_total_before_fault_offset += result.amount
-                    continue
-
-                if isinstance(result, CalculationResult) and result.amount > 0: # 金額が0より大きい場合のみ表示
-                    row = [
-                        Paragraph(result.item_name, self.styles['TableCell']),
-                        Paragraph(f"{result.amount:,.0f}", self.styles['TableCellRight']),
-                    ]
-                    if self.report_config.include_detailed_calculation_in_pdf:
-                        details = result.details or "-"
-                        # detailsが長すぎる場合の処理（例：一定文字数で丸める）
-                        if len(details) > 100: # 例えば100文字以上なら丸める
-                            details = details[:100] + "..."
-                        row.append(Paragraph(details, self.styles['TableCell']))
-                    results_data.append(row)
-                    grand_total_before_fault_offset += result.amount # 過失相殺前の合計に加算
-
-            # 「合計（過失相殺前）」の行を追加
-            total_row_before_offset = [
-                Paragraph("<b>合計（過失相殺前）</b>", self.styles['TableCell']),
-                Paragraph(f"<b>{grand_total_before_fault_offset:,.0f}</b>", self.styles['TableCellRight']),
-            ]
-            if self.report_config.include_detailed_calculation_in_pdf:
-                total_row_before_offset.append(Paragraph("", self.styles['TableCell'])) # 備考欄は空
-            results_data.append(total_row_before_offset)
-            
-            # 過失相殺
-            fault_percentage = self.case_data.person_info.fault_percentage or 0
-            fault_offset_amount = (grand_total_before_fault_offset * Decimal(fault_percentage) / Decimal(100)).quantize(Decimal('1'))
-            
-            offset_row = [
-                Paragraph(f"過失相殺（{fault_percentage}%）", self.styles['TableCell']),
-                Paragraph(f"<u>-{fault_offset_amount:,.0f}</u>", self.styles['TableCellRight']), # 下線を追加
-            ]
-            if self.report_config.include_detailed_calculation_in_pdf:
-                offset_row.append(Paragraph(f"{grand_total_before_fault_offset:,.0f}円 × {fault_percentage}%", self.styles['TableCell']))
-            results_data.append(offset_row)
-
-            # 最終合計金額
-            final_total_amount = grand_total_before_fault_offset - fault_offset_amount
-            final_total_row = [
-                Paragraph("<b>最終合計金額</b>", self.styles['TableCell']), # 太字に変更
-                Paragraph(f"<b>{final_total_amount:,.0f}</b>", self.styles['TableCellRight']), # 太字に変更
-            ]
-            if self.report_config.include_detailed_calculation_in_pdf:
-                final_total_row.append(Paragraph("", self.styles['TableCell'])) # 備考欄は空
-            results_data.append(final_total_row)
-
-            # テーブルスタイル
-            col_widths = [60*mm, 40*mm]
-            if self.report_config.include_detailed_calculation_in_pdf:
-                col_widths.append(None) # 備考欄の幅は残り全て
-
-            results_table = Table(results_data, colWidths=col_widths)
-            table_style_commands = [
-                ('GRID', (0,0), (-1,-1), 0.5, colors.grey),
-                ('BACKGROUND', (0,0), (-1,0), colors.HexColor("#4682B4")), # ヘッダー背景色 (SteelBlue)
-                ('TEXTCOLOR', (0,0), (-1,0), colors.whitesmoke),
-                ('VALIGN', (0,0), (-1,-1), 'MIDDLE'),
-                ('ALIGN', (1,0), (1,-1), 'RIGHT'), # 金額列は右寄せ
-                ('LEFTPADDING', (0,0), (-1,-1), 2*mm),
-                ('RIGHTPADDING', (0,0), (-1,-1), 2*mm),
-                ('LINEBELOW', (0,-2), (-1,-2), 1, colors.black), # 最終合計の上の線
-                ('LINEABOVE', (0, -1), (-1, -1), 1, colors.black, None, None, 2, 0), # 最終合計の二重線の上側
-                ('LINEBELOW', (0, -1), (-1, -1), 0.5, colors.black, None, None, 0, 0), # 最終合計の二重線の下側
-            ]
-            # 最終行のフォントを太字にするスタイル (Paragraph内で<b>タグを使っているので不要かもしれないが念のため)
-            # table_style_commands.append(('FONTNAME', (0, -1), (-1, -1), self.styles['TableCell'].fontName + '-Bold')) # うまく動かない場合がある
-            
-            results_table.setStyle(TableStyle(table_style_commands))
-            story.append(results_table)
-            story.append(Spacer(1, 10*mm))
-
-            # 6. フッター (免責事項など)
-            story.append(Paragraph("---", self.styles['NormalCenter'])) # NormalCenterがないのでNormalで代用、または追加
-            story.append(Spacer(1, 2*mm))
-            disclaimer = "この計算書は、提供された情報に基づいて作成された概算であり、法的な助言や最終的な賠償金額を保証するものではありません。具体的な事案については、弁護士にご相談ください。"
-            story.append(Paragraph(disclaimer, self.styles['SmallText']))
-
-
+            story = self._build_story()
             doc.build(story, onFirstPage=self._add_page_number, onLaterPages=self._add_page_number)
             self.logger.info(f"PDFレポート '{filepath}' が正常に生成されました。")
+            return True
 
         except CompensationSystemError as e: # アプリケーション固有エラー
             self.error_handler.handle_exception(e) # 既に処理されているはずだが、念のため
@@ -369,7 +716,60 @@ class PdfReportGenerator:
                 )
             )
             self.logger.error(f"PDFレポート '{filepath}' の生成中に予期せぬエラー: {e}\n{tb_str}")
-
+        return False
+
+
+    def generate_batch(self, cases_and_results: List[Tuple[CaseData, Dict[str, CalculationResult]]],
+                       output_dir: Optional[str] = None, max_workers: int = 1) -> List[str]:
+        """複数案件のPDFレポートを一括生成する
+
+        max_workers が1の場合はフォント登録とスタイル定義をバッチ全体で1回だけ行い、
+        案件ごとに SimpleDocTemplate のみを新規に作成する。
+        2以上を指定するとプロセスプールで並列生成する（各ワーカーでフォント登録は1回のみ）。
+        """
+        jobs = [
+            (case_data, calculation_results, f"batch_report_{i+1:03d}_{case_data.case_number or 'N-A'}.pdf")
+            for i, (case_data, calculation_results) in enumerate(cases_and_results)
+        ]
+        if max_workers > 1 and len(jobs) > 1:
+            generated_files = self._generate_batch_parallel(jobs, output_dir, max_workers)
+        else:
+            generated_files = self._generate_batch_sequential(jobs, output_dir)
+
+        self.logger.info(f"バッチPDF生成完了: {len(generated_files)}/{len(cases_and_results)}件")
+        return generated_files
+
+    def _generate_batch_sequential(self, jobs: List[Tuple[CaseData, Dict[str, CalculationResult], str]],
+                                   output_dir: Optional[str]) -> List[str]:
+        """このインスタンスのフォント・スタイルを使い回して順次生成する"""
+        self._ensure_fonts_ready()
+        original_case, original_results = self.case_data, self.calculation_results
+        generated_files = []
+        try:
+            for case_data, calculation_results, filename in jobs:
+                filepath = self.emit(case_data, calculation_results, filename, output_dir)
+                if filepath:
+                    generated_files.append(filepath)
+        finally:
+            self.case_data, self.calculation_results = original_case, original_results
+        return generated_files
+
+    def _generate_batch_parallel(self, jobs: List[Tuple[CaseData, Dict[str, CalculationResult], str]],
+                                 output_dir: Optional[str], max_workers: int) -> List[str]:
+        """プロセスプールで並列生成する。プールが使えない環境では順次生成にフォールバック"""
+        try:
+            # ビルド設定で除外される場合があるため遅延インポート
+            from concurrent.futures import ProcessPoolExecutor
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    _generate_report_in_worker,
+                    [(self.config, case_data, calculation_results, filename, output_dir, self.created_at)
+                     for case_data, calculation_results, filename in jobs]
+                ))
+        except Exception as e:
+            self.logger.warning(f"並列PDF生成に失敗したため順次生成に切り替えます: {e}")
+            return self._generate_batch_sequential(jobs, output_dir)
+        return [filepath for filepath in results if filepath]
 
     def _add_page_number(self, canvas, doc):
         """ページ番号を追加する"""
@@ -379,6 +779,32 @@ class PdfReportGenerator:
         canvas.drawCentredString(A4[0]/2, 10*mm, page_num_text)
         canvas.restoreState()
 
+def _generate_report_in_worker(job: Tuple[AppConfig, CaseData, Dict[str, CalculationResult], str, Optional[str], datetime]) -> Optional[str]:
+    """プロセスプールのワーカーで1案件分のPDFを生成する（pickle可能なトップレベル関数）"""
+    config, case_data, calculation_results, filename, output_dir, created_at = job
+    return PdfReportGenerator(config, created_at=created_at).emit(case_data, calculation_results, filename, output_dir)
+
+def generate_many(config: AppConfig,
+                  cases_and_results: List[Tuple[CaseData, Dict[str, CalculationResult], str]],
+                  jobs: Optional[int] = None, output_dir: Optional[str] = None,
+                  created_at: Optional[datetime] = None) -> List[str]:
+    """(案件データ, 計算結果, 出力ファイル名) のリストから複数のPDFをプロセス並列で生成する
+
+    jobs を省略した場合はCPUコア数分のワーカーを使う。フォント登録はワーカープロセスごとに1回のみ行われる。
+    作成日（created_at、省略時は呼び出し時刻）は全レポートで共通の値を使う。
+    生成に成功したファイルパスのリストを返す。
+    """
+    if not cases_and_results:
+        return []
+    generator = PdfReportGenerator(config, created_at=created_at)
+    workers = jobs or os.cpu_count() or 1
+    if workers > 1 and len(cases_and_results) > 1:
+        generated_files = generator._generate_batch_parallel(cases_and_results, output_dir, workers)
+    else:
+        generated_files = generator._generate_batch_sequential(cases_and_results, output_dir)
+    generator.logger.info(f"並列PDF生成完了: {len(generated_files)}/{len(cases_and_results)}件（ワーカー数: {workers}）")
+    return generated_files
+
 # 使用例 (テスト用)
 if __name__ == '__main__':
     from config.app_config import load_config
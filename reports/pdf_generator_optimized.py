@@ -38,7 +38,7 @@ class PdfTemplateManager:
         self.templates = {}
         self._initialize_templates()
     
-    @monitor_performance
+    @monitor_performance()
     def _initialize_templates(self):
         """テンプレートを初期化"""
         try:
@@ -106,7 +106,7 @@ class PdfTemplateManager:
             }
         }
     
-    @monitor_performance
+    @monitor_performance()
     def get_template(self, template_name: str) -> Optional[Dict[str, Any]]:
         """指定されたテンプレートを取得"""
         template = self.templates.get(template_name)
@@ -115,7 +115,7 @@ class PdfTemplateManager:
             return self.templates.get('traffic_accident')  # デフォルト
         return template
     
-    @monitor_performance
+    @monitor_performance()
     def apply_template_data(self, template: Dict[str, Any], case_data: CaseData) -> Dict[str, Any]:
         """テンプレートにケースデータを適用"""
         try:
@@ -170,7 +170,7 @@ class PdfReportGeneratorOptimized:
         
         self.logger.info("最適化版PDFレポート生成システムを初期化しました")
 
-    @monitor_performance
+    @monitor_performance()
     def _register_fonts(self):
         """設定に基づいてフォントを登録する"""
         font_name_gothic = self.report_config.font_name_gothic
@@ -213,12 +213,19 @@ class PdfReportGeneratorOptimized:
             )
             self.logger.warning(f"日本語フォント '{font_name_gothic}' の読み込みに失敗。PDFの日本語表示に問題が出る可能性があります。")
 
-    @monitor_performance
+    @monitor_performance()
     def _initialize_styles(self):
         """設定に基づいてカスタムスタイルを初期化"""
         font_name_gothic = self.report_config.font_name_gothic
         # フォントが正常に登録されたか確認し、されていなければデフォルトフォントを使用
-        base_font = font_name_gothic if pdfmetrics.getFont(font_name_gothic, None) else 'Helvetica'
+        # （getFont は未登録のフォント名に対して KeyError を送出する）
+        try:
+            pdfmetrics.getFont(font_name_gothic)
+            base_font = font_name_gothic
+        except KeyError:
+            base_font = 'Helvetica'
+        # 表のスタイルでも同じフォントを使う（未登録のフォント名を指定すると PDF の構築時に失敗するため）
+        self.base_font = base_font
         
         if base_font == 'Helvetica' and font_name_gothic:
             self.logger.warning(f"指定されたフォント '{font_name_gothic}' が利用できないため、Helveticaにフォールバックします。")
@@ -277,7 +284,7 @@ class PdfReportGeneratorOptimized:
         self.styles.add(ParagraphStyle(name='Normal_jp', fontSize=10, alignment=TA_LEFT, spaceAfter=3*mm, fontName=base_font, leading=12))
         self.styles.add(ParagraphStyle(name='TableText', fontSize=9, alignment=TA_CENTER, fontName=base_font, leading=10))
 
-    @monitor_performance
+    @monitor_performance()
     def create_compensation_report(self, case_data: CaseData, results: Dict[str, CalculationResult], 
                                  template_type: str = 'traffic_accident', 
                                  filename: Optional[str] = None) -> str:
@@ -306,7 +313,7 @@ class PdfReportGeneratorOptimized:
                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                 filename = f"compensation_report_{template_type}_{timestamp}.pdf"
             
-            output_path = os.path.join(self.report_config.output_directory, filename)
+            output_path = os.path.join(self.report_config.default_output_directory, filename)
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
             
             # PDF文書作成
@@ -339,15 +346,10 @@ class PdfReportGeneratorOptimized:
             doc.build(story)
             self.performance_monitor.end_timing('pdf_build')
             
-            self.performance_monitor.end_timing('pdf_generation_total')
+            duration = self.performance_monitor.end_timing('pdf_generation_total')
             
             self.logger.info(f"PDF レポート生成完了: {output_path}")
-            
-            # パフォーマンス統計をログ出力
-            stats = self.performance_monitor.get_statistics()
-            if 'pdf_generation_total' in stats:
-                duration = stats['pdf_generation_total']['total_time']
-                self.logger.info(f"PDF生成時間: {duration:.2f}秒")
+            self.logger.info(f"PDF生成時間: {duration:.2f}秒")
             
             return output_path
             
@@ -371,7 +373,7 @@ class PdfReportGeneratorOptimized:
             self.logger.error(f"PDF生成エラー: {error_msg}")
             raise
 
-    @monitor_performance
+    @monitor_performance()
     def _create_header_section(self, case_data: CaseData, template: Optional[Dict[str, Any]]) -> List:
         """ヘッダーセクションを作成"""
         story = []
@@ -396,14 +398,14 @@ class PdfReportGeneratorOptimized:
         basic_info_data = [
             ['作成日時', datetime.now().strftime("%Y年%m月%d日 %H:%M")],
             ['事件番号', getattr(case_data, 'case_number', '未設定')],
-            ['依頼者名', getattr(case_data, 'client_name', '未設定')],
+            ['依頼者名', case_data.person_info.name or '未設定'],
             ['作成者', getattr(self.report_config, 'creator_name', '未設定')]
         ]
         
         basic_info_table = Table(basic_info_data, colWidths=[40*mm, 80*mm])
         basic_info_table.setStyle(TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, -1), self.report_config.font_name_gothic or 'Helvetica'),
+            ('FONTNAME', (0, 0), (-1, -1), self.base_font),
             ('FONTSIZE', (0, 0), (-1, -1), 10),
             ('GRID', (0, 0), (-1, -1), 1, colors.black),
             ('BACKGROUND', (0, 0), (0, -1), colors.lightgrey),
@@ -414,7 +416,7 @@ class PdfReportGeneratorOptimized:
         
         return story
 
-    @monitor_performance
+    @monitor_performance()
     def _create_calculation_sections(self, case_data: CaseData, results: Dict[str, CalculationResult], 
                                    template: Optional[Dict[str, Any]]) -> List:
         """計算結果セクションを作成"""
@@ -456,18 +458,18 @@ class PdfReportGeneratorOptimized:
                     section_data.append([
                         result.item_name or item,
                         formatted_amount,
-                        result.calculation_method or '標準計算'
+                        result.legal_basis or '標準計算'
                     ])
             
             if section_data:
                 # テーブルヘッダー
-                section_data.insert(0, ['項目', '金額', '計算方法'])
+                section_data.insert(0, ['項目', '金額', '計算根拠'])
                 
                 section_table = Table(section_data, colWidths=[60*mm, 40*mm, 60*mm])
                 section_table.setStyle(TableStyle([
                     ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
                     ('ALIGN', (1, 1), (1, -1), 'RIGHT'),  # 金額は右寄せ
-                    ('FONTNAME', (0, 0), (-1, -1), self.report_config.font_name_gothic or 'Helvetica'),
+                    ('FONTNAME', (0, 0), (-1, -1), self.base_font),
                     ('FONTSIZE', (0, 0), (-1, -1), 9),
                     ('GRID', (0, 0), (-1, -1), 1, colors.black),
                     ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),  # ヘッダー背景
@@ -478,7 +480,7 @@ class PdfReportGeneratorOptimized:
         
         return story
 
-    @monitor_performance
+    @monitor_performance()
     def _create_summary_section(self, results: Dict[str, CalculationResult], 
                               template: Optional[Dict[str, Any]]) -> List:
         """サマリーセクションを作成"""
@@ -503,7 +505,7 @@ class PdfReportGeneratorOptimized:
         summary_table.setStyle(TableStyle([
             ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
             ('ALIGN', (1, 1), (1, -1), 'RIGHT'),
-            ('FONTNAME', (0, 0), (-1, -1), self.report_config.font_name_gothic or 'Helvetica'),
+            ('FONTNAME', (0, 0), (-1, -1), self.base_font),
             ('FONTSIZE', (0, 0), (-1, -1), 11),
             ('GRID', (0, 0), (-1, -1), 1, colors.black),
             ('BACKGROUND', (0, 0), (-1, 0), colors.lightgrey),
@@ -546,9 +548,9 @@ class PdfReportGeneratorOptimized:
         """通貨フォーマット"""
         return f"¥{amount:,.0f}"
 
-    @monitor_performance
+    @monitor_performance()
     def generate_batch_reports(self, case_list: List[Dict], template_type: str = 'traffic_accident') -> List[str]:
-        """複数ケースのバッチレポート生成"""
+        """複数ケースのバッチレポート生成（各要素の 'template_type' / 'filename' で個別指定も可能）"""
         generated_files = []
         
         try:
@@ -558,10 +560,11 @@ class PdfReportGeneratorOptimized:
                 try:
                     case_data = case_info['case_data']
                     results = case_info['results']
-                    filename = f"batch_report_{i+1:03d}_{template_type}.pdf"
+                    case_template_type = case_info.get('template_type', template_type)
+                    filename = case_info.get('filename') or f"batch_report_{i+1:03d}_{case_template_type}.pdf"
                     
                     output_path = self.create_compensation_report(
-                        case_data, results, template_type, filename
+                        case_data, results, case_template_type, filename
                     )
                     generated_files.append(output_path)
                     
@@ -569,14 +572,11 @@ class PdfReportGeneratorOptimized:
                     self.logger.error(f"バッチ処理 {i+1} でエラー: {str(e)}")
                     continue
             
-            self.performance_monitor.end_timing('batch_pdf_generation')
+            total_time = self.performance_monitor.end_timing('batch_pdf_generation')
             
             # バッチ処理統計
-            stats = self.performance_monitor.get_statistics()
-            if 'batch_pdf_generation' in stats:
-                total_time = stats['batch_pdf_generation']['total_time']
-                avg_time = total_time / len(case_list) if case_list else 0
-                self.logger.info(f"バッチPDF生成完了: {len(generated_files)}件, 総時間: {total_time:.2f}秒, 平均: {avg_time:.2f}秒/件")
+            avg_time = total_time / len(case_list) if case_list else 0
+            self.logger.info(f"バッチPDF生成完了: {len(generated_files)}件, 総時間: {total_time:.2f}秒, 平均: {avg_time:.2f}秒/件")
             
             return generated_files
             
@@ -5,18 +5,25 @@
 """
 
 import pytest
+import copy
 import sys
 import os
 from pathlib import Path
 
-# プロジェクトルートをパスに追加
+# プロジェクトルートをパスに追加（各テストモジュールでは追加せず、ここで1回だけ行う）
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
+def pytest_addoption(parser):
+    """コマンドラインオプションの追加"""
+    parser.addoption(
+        "--runslow", action="store_true", default=False, help="slow マーカー付きのテストも実行する"
+    )
+
 def pytest_configure(config):
     """pytest設定"""
     config.addinivalue_line(
-        "markers", "slow: marks tests as slow (deselect with '-m \"not slow\"')"
+        "markers", "slow: marks tests as slow (skipped unless --runslow is given)"
     )
     config.addinivalue_line(
         "markers", "integration: marks tests as integration tests"
@@ -27,7 +34,12 @@ def pytest_configure(config):
 
 def pytest_collection_modifyitems(config, items):
     """テストアイテムの修正"""
+    skip_slow = pytest.mark.skip(reason="--runslow を指定した場合のみ実行")
+    run_slow = config.getoption("--runslow")
     for item in items:
+        # 時間のかかるテストは --runslow 指定時のみ実行
+        if not run_slow and "slow" in item.keywords:
+            item.add_marker(skip_slow)
         # 統合テストディレクトリのテストに統合テストマーカーを追加
         if "integration" in str(item.fspath):
             item.add_marker(pytest.mark.integration)
@@ -40,14 +52,22 @@ def test_data_dir():
     """テストデータディレクトリ"""
     return Path(__file__).parent / "test_data"
 
+def _xdist_worker_id(config) -> str:
+    """pytest-xdist のワーカーID（並列実行でない場合は "master"）"""
+    return getattr(config, "workerinput", {}).get("workerid", "master")
+
 @pytest.fixture(scope="session")
-def temp_db_path(tmp_path_factory):
-    """一時的なテストデータベースパス"""
-    return tmp_path_factory.mktemp("test_db") / "test_compensation.db"
+def temp_db_path(request, tmp_path_factory):
+    """一時的なテストデータベースパス（pytest -n auto でもワーカーごとに別ファイルになるようワーカーIDで分ける）"""
+    worker_id = _xdist_worker_id(request.config)
+    return tmp_path_factory.mktemp(f"test_db-{worker_id}") / "test_compensation.db"
 
-@pytest.fixture
-def sample_case_data():
-    """サンプル案件データ"""
+@pytest.fixture(scope="session")
+def _base_case_data():
+    """サンプル案件データの原本（セッションで1回だけ構築する）
+
+    案件データを変更しないテストは複製を省くため直接使ってよい。変更するテストは sample_case_data を使うこと。
+    """
     from models.case_data import CaseData, PersonInfo, AccidentInfo, MedicalInfo, IncomeInfo
     from datetime import datetime, date
     
@@ -91,10 +111,34 @@ def sample_case_data():
     return case_data
 
 @pytest.fixture
-def mock_database_manager(temp_db_path):
-    """モックデータベースマネージャー"""
+def sample_case_data(_base_case_data):
+    """サンプル案件データ（テストごとに原本の複製を渡すため、変更しても他のテストに影響しない）"""
+    return copy.deepcopy(_base_case_data)
+
+# テストごとに内容を消去するテーブル（settings は初期化時の既定値を保つため対象外）
+_DATA_TABLES = ("cases", "calculation_history", "backup_records", "case_templates")
+
+@pytest.fixture(scope="module")
+def _module_database_manager():
+    """モジュール内で共有するデータベースマネージャー（スキーマ作成はモジュールごとに1回だけ）
+
+    ディスク上の耐久性は検証しないため、ページ書き込みや fsync のないメモリ上のDBを使う。
+    """
     from database.db_manager import DatabaseManager
-    return DatabaseManager(str(temp_db_path))
+    manager = DatabaseManager.in_memory()
+    yield manager
+    manager.close()
+
+@pytest.fixture
+def mock_database_manager(_module_database_manager):
+    """モックデータベースマネージャー（モジュール内で共有するメモリ上のDB）
+
+    テスト終了時に各データテーブルの内容を消去し、他のテストから独立させる。
+    """
+    yield _module_database_manager
+    _module_database_manager.execute_script(
+        "".join(f"DELETE FROM {table};" for table in _DATA_TABLES)
+    )
 
 @pytest.fixture
 def mock_config():
@@ -0,0 +1,27 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+統合テスト用フィクスチャ
+"""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def calc_engine():
+    """計算エンジン（状態を持たないためモジュール内のテストで共有する）"""
+    from calculation.compensation_engine import CompensationEngine
+    return CompensationEngine()
+
+
+@pytest.fixture
+def db_manager():
+    """テストごとに専用のメモリ上のDBを使うデータベースマネージャー
+
+    バックアップ・復元のテストはファイルが必要なため、このフィクスチャを使わずに
+    tmp_path 上のDBを作成する。
+    """
+    from database.db_manager import DatabaseManager
+    manager = DatabaseManager.in_memory()
+    yield manager
+    manager.close()
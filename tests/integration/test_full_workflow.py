@@ -9,10 +9,8 @@ import tempfile
 import json
 from pathlib import Path
 from datetime import datetime, date
-import sys
-import os
-
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
+from dataclasses import replace
+from decimal import Decimal
 
 from database.db_manager import DatabaseManager
 from calculation.compensation_engine import CompensationEngine
@@ -22,44 +20,31 @@ from models.case_data import CaseData
 class TestIntegration:
     """統合テストクラス"""
     
-    def test_end_to_end_case_processing(self, sample_case_data, tmp_path):
+    def test_end_to_end_case_processing(self, sample_case_data, db_manager, calc_engine):
         """エンドツーエンドの案件処理テスト"""
-        # 一時的なデータベースファイル
-        db_path = tmp_path / "test_integration.db"
-        
-        # データベースマネージャーを初期化
-        db_manager = DatabaseManager(str(db_path))
-        
-        # 計算エンジンを初期化
-        calc_engine = CompensationEngine()
-        
         # 1. 案件データを保存
         save_success = db_manager.save_case(sample_case_data)
         assert save_success, "案件データの保存に失敗"
         
-        # 2. 保存した案件データを読み込み
-        loaded_case = db_manager.load_case(sample_case_data.case_number)
-        assert loaded_case is not None, "案件データの読み込みに失敗"
-        assert loaded_case.case_number == sample_case_data.case_number
-        
-        # 3. 読み込んだデータで損害賠償を計算
-        calc_result = calc_engine.calculate_compensation(loaded_case)
-        assert calc_result is not None, "損害賠償計算に失敗"
-        assert 'total_compensation' in calc_result
-        assert calc_result['total_compensation'] > 0
+        # 2. メモリ上の案件データで損害賠償を計算
+        calc_results = calc_engine.calculate_all(sample_case_data)
+        assert 'summary' in calc_results, "損害賠償計算に失敗"
+        assert calc_results['summary'].amount > 0
         
-        # 4. 計算結果を案件データに保存
-        loaded_case.calculation_results = calc_result
-        update_success = db_manager.save_case(loaded_case)
+        # 3. 計算結果の列のみを更新（保存用に各項目を辞書へ変換する）
+        calc_result = {key: result.to_dict() for key, result in calc_results.items()}
+        update_success = db_manager.update_calculation_results(sample_case_data.case_number, calc_result)
         assert update_success, "計算結果の保存に失敗"
         
-        # 5. 計算結果を含めて再度読み込み
+        # 4. 最後に1回だけ読み込み、案件本体と計算結果の両方が保存されていることを確認
         final_case = db_manager.load_case(sample_case_data.case_number)
-        assert final_case is not None
-        assert 'total_compensation' in final_case.calculation_results
-        assert final_case.calculation_results['total_compensation'] > 0
+        assert final_case is not None, "案件データの読み込みに失敗"
+        assert final_case.case_number == sample_case_data.case_number
+        assert final_case.person_info.name == sample_case_data.person_info.name
+        assert final_case.calculation_results == calc_result
+        assert Decimal(final_case.calculation_results['summary']['amount']) > 0
     
-    def test_config_and_calculation_integration(self, sample_case_data, tmp_path):
+    def test_config_and_calculation_integration(self, sample_case_data, tmp_path, calc_engine):
         """設定管理と計算の統合テスト"""
         # 一時的な設定ファイル
         config_path = tmp_path / "test_config.json"
@@ -72,12 +57,8 @@ class TestIntegration:
         config.calculation.default_standard = "弁護士基準"
         config.calculation.precision_digits = 0
         config.calculation.rounding_method = "round"
-        config_manager.save_config()
-        
-        # 計算エンジンで設定を使用
-        calc_engine = CompensationEngine()
         
-        # 設定に基づいて計算
+        # 設定に基づいて計算（計算はメモリ上の設定を参照するためファイル保存は不要）
         result = calc_engine.calculate_compensation(
             sample_case_data, 
             config.calculation.default_standard
@@ -86,11 +67,21 @@ class TestIntegration:
         assert result is not None
         assert isinstance(result['total_compensation'], int)  # 精度0で整数
     
-    def test_template_workflow(self, sample_case_data, tmp_path):
-        """テンプレート機能のワークフローテスト"""
-        db_path = tmp_path / "test_template.db"
-        db_manager = DatabaseManager(str(db_path))
+    def test_config_persistence(self, tmp_path):
+        """設定の保存内容の確認テスト"""
+        config_path = tmp_path / "test_config.json"
+        
+        config_manager = ConfigManager(str(config_path))
+        config_manager.get_config().calculation.default_standard = "弁護士基準"
+        
+        # ConfigManager はシングルトンのため、保存先を明示して一時ファイルに書き出す
+        config_manager.save_config(config_path)
         
+        saved = json.loads(config_path.read_text(encoding='utf-8'))
+        assert saved['calculation']['default_standard'] == "弁護士基準"
+    
+    def test_template_workflow(self, sample_case_data, db_manager):
+        """テンプレート機能のワークフローテスト"""
         template_name = "交通事故標準テンプレート"
         
         # 1. 案件データをテンプレートとして保存
@@ -122,12 +113,8 @@ class TestIntegration:
         # テンプレートの他の情報は保持されていることを確認
         assert saved_case.accident_info.accident_type == sample_case_data.accident_info.accident_type
     
-    def test_search_and_calculation_workflow(self, tmp_path):
+    def test_search_and_calculation_workflow(self, db_manager, calc_engine):
         """検索と計算の統合ワークフロー"""
-        db_path = tmp_path / "test_search.db"
-        db_manager = DatabaseManager(str(db_path))
-        calc_engine = CompensationEngine()
-        
         # 複数の案件データを作成
         cases = []
         for i in range(5):
@@ -139,9 +126,12 @@ class TestIntegration:
             case.income_info.basic_annual_income = 3000000 + (i * 500000)
             cases.append(case)
         
-        # 案件を保存
+        # 損害賠償計算を行い、計算結果付きの5件を1回の executemany で保存
         for case in cases:
-            db_manager.save_case(case)
+            compensation = calc_engine.calculate_all(case)
+            assert compensation['summary'].amount > 0
+            case.calculation_results = {key: result.to_dict() for key, result in compensation.items()}
+        assert db_manager.save_cases(cases)
         
         # 案件を検索
         search_results = db_manager.search_cases(
@@ -149,20 +139,12 @@ class TestIntegration:
         )
         assert len(search_results) == 5
         
-        # 検索結果の各案件で計算を実行
+        # 検索結果をメモリ上の案件と突き合わせる（load_case の往復は不要）
+        cases_by_number = {c.case_number: c for c in cases}
         for result in search_results:
-            case_number = result['case_number']
-            case_data = db_manager.load_case(case_number)
-            assert case_data is not None
-            
-            # 損害賠償計算
-            compensation = calc_engine.calculate_compensation(case_data)
-            assert compensation is not None
-            assert compensation['total_compensation'] > 0
-            
-            # 計算結果を保存
-            case_data.calculation_results = compensation
-            db_manager.save_case(case_data)
+            case_data = cases_by_number[result['case_number']]
+            assert result['client_name'] == case_data.person_info.name
+            assert Decimal(case_data.calculation_results['summary']['amount']) > 0
         
         # 統計情報を確認
         stats = db_manager.get_statistics()
@@ -176,7 +158,7 @@ class TestIntegration:
         backup_dir.mkdir()
         
         # 元のデータベースに案件を保存
-        original_db = DatabaseManager(str(original_db_path))
+        original_db = DatabaseManager(str(original_db_path), tuning="fast")
         original_db.save_case(sample_case_data)
         
         # バックアップを作成
@@ -189,7 +171,7 @@ class TestIntegration:
         
         # バックアップファイルから復元
         backup_file = backup_files[0]
-        restored_db = DatabaseManager(str(backup_file))
+        restored_db = DatabaseManager(str(backup_file), tuning="fast")
         
         # 復元されたデータを確認
         restored_case = restored_db.load_case(sample_case_data.case_number)
@@ -197,12 +179,8 @@ class TestIntegration:
         assert restored_case.case_number == sample_case_data.case_number
         assert restored_case.person_info.name == sample_case_data.person_info.name
     
-    def test_error_handling_integration(self, tmp_path):
+    def test_error_handling_integration(self, db_manager, calc_engine):
         """エラーハンドリングの統合テスト"""
-        db_path = tmp_path / "error_test.db"
-        db_manager = DatabaseManager(str(db_path))
-        calc_engine = CompensationEngine()
-        
         # 不正なデータでのテスト
         invalid_case = CaseData()
         invalid_case.case_number = "ERROR-TEST"
@@ -216,27 +194,20 @@ class TestIntegration:
         calc_result = calc_engine.calculate_compensation(invalid_case)
         assert isinstance(calc_result, dict)  # エラーでも辞書を返す
     
-    def test_multi_standard_calculation_comparison(self, sample_case_data, tmp_path):
+    def test_multi_standard_calculation_comparison(self, sample_case_data, db_manager, calc_engine):
         """複数基準での計算比較テスト"""
-        db_path = tmp_path / "multi_standard.db"
-        db_manager = DatabaseManager(str(db_path))
-        calc_engine = CompensationEngine()
-        
-        # 案件を保存
-        db_manager.save_case(sample_case_data)
-        
-        # 3つの基準で計算
+        # 3つの基準で計算（すべてメモリ上で行う）
         standards = ["自賠責基準", "任意保険基準", "弁護士基準"]
-        results = {}
-        
-        for standard in standards:
-            result = calc_engine.calculate_compensation(sample_case_data, standard)
-            results[standard] = result
-            
-            # 計算結果を案件データに保存（基準別）
-            case_copy = db_manager.load_case(sample_case_data.case_number)
-            case_copy.calculation_results[f'{standard}_result'] = result
-            db_manager.save_case(case_copy)
+        results = {
+            standard: calc_engine.calculate_compensation(sample_case_data, standard)
+            for standard in standards
+        }
+        
+        # 基準別の計算結果を案件データに反映し、1回だけ保存
+        sample_case_data.calculation_results.update(
+            {f'{standard}_result': result for standard, result in results.items()}
+        )
+        assert db_manager.save_case(sample_case_data)
         
         # 基準の順序確認（弁護士基準が最高額）
         jibaiseki = results["自賠責基準"]['total_compensation']
@@ -250,34 +221,35 @@ class TestIntegration:
         assert '弁護士基準_result' in final_case.calculation_results
         assert '自賠責基準_result' in final_case.calculation_results
     
-    def test_performance_benchmark(self, tmp_path):
+    @pytest.mark.slow
+    def test_performance_benchmark(self, db_manager, calc_engine):
         """パフォーマンスベンチマークテスト"""
         import time
         
-        db_path = tmp_path / "performance.db"
-        db_manager = DatabaseManager(str(db_path))
-        calc_engine = CompensationEngine()
-        
         # 100件の案件データを作成・保存・計算
         start_time = time.time()
         
         cases_count = 100
-        for i in range(cases_count):
-            case = CaseData()
-            case.case_number = f"PERF-{i:04d}"
-            case.person_info.name = f"パフォーマンステスト{i}"
-            case.person_info.age = 20 + (i % 50)
-            case.income_info.basic_annual_income = 3000000 + (i * 10000)
-            case.accident_info.accident_type = "交通事故"
-            case.medical_info.treatment_days = 30 + (i % 100)
-            
-            # 保存
-            db_manager.save_case(case)
-            
-            # 計算
-            result = calc_engine.calculate_compensation(case)
-            case.calculation_results = result
-            db_manager.save_case(case)
+        # 全件共通の値を持つ雛形を1回だけ作り、ループでは案件ごとに異なる値だけを差し替える
+        # （accident_info など変更しない部分は雛形のオブジェクトを共有する）
+        base = CaseData()
+        base.accident_info.accident_type = "交通事故"
+        
+        # 全件の保存を1トランザクションにまとめ、保存ごとのコミットを省く
+        with db_manager.bulk_write():
+            for i in range(cases_count):
+                case = replace(
+                    base,
+                    case_number=f"PERF-{i:04d}",
+                    person_info=replace(base.person_info, name=f"パフォーマンステスト{i}", age=20 + (i % 50)),
+                    income_info=replace(base.income_info, basic_annual_income=3000000 + (i * 10000)),
+                    medical_info=replace(base.medical_info, actual_outpatient_days=30 + (i % 100)),
+                )
+                
+                # 計算してから1回だけ保存（最終的に計算結果付きで保存される点は従来と同じ）
+                results = calc_engine.calculate_all(case)
+                case.calculation_results = {key: result.to_dict() for key, result in results.items()}
+                db_manager.save_case(case)
         
         end_time = time.time()
         total_time = end_time - start_time
@@ -11,7 +11,6 @@ import os
 import sys
 from datetime import date
 from decimal import Decimal
-import time  # 追加
 
 # パスの設定
 sys.path.insert(0, os.path.abspath('.'))
@@ -156,7 +155,8 @@ class SimpleIntegrationTest(unittest.TestCase):
         
         # 基本メソッドが動作するかテスト
         monitor.start_timing('test_operation')
-        time.sleep(0.1)  # 短時間待機
+        # 待機する代わりに開始時刻を0.1秒前にずらして経過時間の計算を確認する
+        monitor._timing_data['test_operation'] -= 0.1
         elapsed = monitor.end_timing('test_operation')
         
         self.assertGreater(elapsed, 0.05)  # 最低0.05秒は経過しているはず
@@ -9,12 +9,9 @@ import json
 import tempfile
 from pathlib import Path
 from datetime import datetime, date
+from decimal import Decimal
 from unittest.mock import patch, MagicMock
 
-import sys
-import os
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..'))
-
 from database.db_manager import DatabaseManager
 from models.case_data import CaseData
 
@@ -23,7 +20,7 @@ class TestDatabaseManager:
     
     def test_init_database(self, temp_db_path):
         """データベース初期化のテスト"""
-        db_manager = DatabaseManager(str(temp_db_path))
+        db_manager = DatabaseManager(str(temp_db_path), tuning="fast")
         
         # データベースファイルが作成されることを確認
         assert temp_db_path.exists()
@@ -213,7 +210,205 @@ class TestDatabaseManager:
         assert results['success_count'] == 10
         assert results['failed_count'] == 0
         
-        # 保存されたことを確認
-        for case in cases:
-            loaded = mock_database_manager.load_case(case.case_number)
-            assert loaded is not None
+        # 保存されたことを1回の一括読み込みで確認
+        loaded = mock_database_manager.load_cases_bulk([c.case_number for c in cases])
+        assert len(loaded) == 10
+        assert {c.case_number for c in loaded} == {c.case_number for c in cases}
+    
+    def test_batch_save_cases_reports_per_case(self, mock_database_manager):
+        """一括保存で失敗した案件だけが失敗として集計され、他の案件は保存されることのテスト"""
+        valid = CaseData()
+        valid.case_number = "BATCH-PARTIAL-001"
+        invalid = CaseData()  # case_number が空のため保存できない
+        
+        results = mock_database_manager.batch_save_cases([valid, invalid])
+        assert results['success_count'] == 1
+        assert results['failed_count'] == 1
+        assert results['errors'] == ["保存失敗: "]
+        assert mock_database_manager.load_case("BATCH-PARTIAL-001") is not None
+
+    def test_load_cases_bulk(self, mock_database_manager):
+        """複数案件の一括読み込みのテスト"""
+        for i in range(3):
+            case = CaseData()
+            case.case_number = f"BULK-LOAD-{i:03d}"
+            case.person_info.name = f"一括読込{i}号"
+            assert mock_database_manager.save_case(case)
+        mock_database_manager.delete_case("BULK-LOAD-002")
+        
+        # 存在しない案件・アーカイブ済みの案件・重複は結果に含まれない
+        loaded = mock_database_manager.load_cases_bulk(
+            ["BULK-LOAD-000", "BULK-LOAD-001", "BULK-LOAD-001", "BULK-LOAD-002", "NONEXISTENT-CASE"]
+        )
+        assert sorted(c.case_number for c in loaded) == ["BULK-LOAD-000", "BULK-LOAD-001"]
+        assert {c.person_info.name for c in loaded} == {"一括読込0号", "一括読込1号"}
+        
+        assert mock_database_manager.load_cases_bulk([]) == []
+
+    def test_json_dumps_same_with_and_without_orjson(self, monkeypatch):
+        """orjson の有無で保存用JSONの内容が変わらないことのテスト"""
+        pytest.importorskip("orjson")
+        from database import db_manager as db_module
+        from calculation.compensation_engine import CalculationResult
+        from utils.error_handler import ErrorSeverity
+        
+        payload = {
+            'summary': CalculationResult("総合計", Decimal('1234567'), "計算詳細"),
+            'created': datetime(2024, 1, 15, 9, 30),
+            'accident_date': date(2024, 1, 15),
+            'amount': Decimal('1000.5'),
+            'severity': ErrorSeverity.HIGH,
+            1: ["通院", 30, 0.5, None, True],
+        }
+        with_orjson = db_module._json_dumps(payload)
+        monkeypatch.setattr(db_module, "orjson", None)
+        assert db_module._json_dumps(payload) == with_orjson
+    
+    def test_bulk_write_commits_once(self, tmp_path):
+        """bulk_write 内の保存が1トランザクションでコミットされることのテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "bulk.db"), tuning="fast")
+
+        with db_manager.bulk_write():
+            for i in range(3):
+                case = CaseData()
+                case.case_number = f"BULK-TEST-{i:03d}"
+                assert db_manager.save_case(case)
+                # 同じ案件の再保存（更新）も同じトランザクション内で行える
+                assert db_manager.save_case(case)
+
+        for i in range(3):
+            assert db_manager.load_case(f"BULK-TEST-{i:03d}") is not None
+
+    def test_bulk_write_rollback_on_error(self, tmp_path):
+        """bulk_write 内で例外が発生した場合にロールバックされることのテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "bulk_rollback.db"), tuning="fast")
+
+        with pytest.raises(RuntimeError):
+            with db_manager.bulk_write():
+                case = CaseData()
+                case.case_number = "BULK-ROLLBACK-001"
+                assert db_manager.save_case(case)
+                raise RuntimeError("テスト用の例外")
+
+        assert db_manager.load_case("BULK-ROLLBACK-001") is None
+
+    def test_bulk_write_uses_shared_connection(self, mock_database_manager):
+        """bulk_write 中の未コミットの行が共有接続の読み込みから見えることのテスト"""
+        with pytest.raises(RuntimeError):
+            with mock_database_manager.bulk_write():
+                case = CaseData()
+                case.case_number = "BULK-SHARED-001"
+                assert mock_database_manager.save_case(case)
+                assert mock_database_manager.load_case("BULK-SHARED-001") is not None
+                # ブロック内の commit=True はコミットせず、ロールバックの対象になる
+                mock_database_manager.execute_query(
+                    "UPDATE cases SET status = ? WHERE case_number = ?", ("完了", "BULK-SHARED-001"), commit=True
+                )
+                raise RuntimeError("テスト用の例外")
+
+        assert mock_database_manager.load_case("BULK-SHARED-001") is None
+
+    def test_save_case_skips_unchanged_body(self, tmp_path):
+        """本体が変わっていない再保存では計算結果のみ更新されることのテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "hash.db"), tuning="fast")
+        case = CaseData()
+        case.case_number = "HASH-TEST-001"
+        case.person_info.name = "ハッシュ太郎"
+        assert db_manager.save_case(case)
+
+        def stored_hash():
+            row = db_manager.execute_query(
+                "SELECT content_hash FROM cases WHERE case_number = ?",
+                (case.case_number,), fetch_one=True
+            )
+            return row[0]
+
+        first_hash = stored_hash()
+        assert first_hash
+
+        # 計算結果のみ変更して再保存
+        case.calculation_results = {"total_compensation": 1000000}
+        assert db_manager.save_case(case)
+        assert stored_hash() == first_hash
+        loaded = db_manager.load_case(case.case_number)
+        assert loaded.calculation_results["total_compensation"] == 1000000
+
+        # 本体を変更するとハッシュも更新される
+        case.person_info.name = "ハッシュ次郎"
+        assert db_manager.save_case(case)
+        assert stored_hash() != first_hash
+        assert db_manager.load_case(case.case_number).person_info.name == "ハッシュ次郎"
+
+    def test_update_calculation_results(self, tmp_path, sample_case_data):
+        """計算結果の列のみを更新するテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "results.db"), tuning="fast")
+        db_manager.save_case(sample_case_data)
+
+        success = db_manager.update_calculation_results(
+            sample_case_data.case_number, {"total_compensation": 2500000}
+        )
+        assert success
+
+        loaded = db_manager.load_case(sample_case_data.case_number)
+        assert loaded.calculation_results["total_compensation"] == 2500000
+        assert loaded.person_info.name == sample_case_data.person_info.name
+
+        # 存在しない案件は更新されない
+        assert not db_manager.update_calculation_results("NONEXISTENT-CASE", {})
+
+    def test_save_cases(self, tmp_path):
+        """複数案件の一括保存（新規作成と更新）のテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "save_cases.db"), tuning="fast")
+        cases = []
+        for i in range(3):
+            case = CaseData()
+            case.case_number = f"SAVE-CASES-{i:03d}"
+            case.person_info.name = f"一括{i}号"
+            cases.append(case)
+        assert db_manager.save_cases(cases)
+        first_id = db_manager.load_case_by_id(1)['case_number']
+
+        # 既存案件の更新では id が変わらない
+        cases[0].person_info.name = "一括更新"
+        assert db_manager.save_cases(cases)
+        assert db_manager.load_case_by_id(1)['case_number'] == first_id
+        assert db_manager.load_case("SAVE-CASES-000").person_info.name == "一括更新"
+
+        # 案件番号が空の案件を含む場合は保存しない
+        invalid = CaseData()
+        invalid.case_number = ""
+        assert not db_manager.save_cases([invalid])
+
+    def test_in_memory_database(self):
+        """メモリ上のDBが接続をまたいで保持され、インスタンスごとに独立していることのテスト"""
+        db_manager = DatabaseManager.in_memory()
+        case = CaseData()
+        case.case_number = "MEMORY-TEST-001"
+        assert db_manager.save_case(case)
+        assert db_manager.load_case("MEMORY-TEST-001") is not None
+
+        other = DatabaseManager.in_memory()
+        assert other.load_case("MEMORY-TEST-001") is None
+
+    def test_uri_database_path(self):
+        """"file:" で始まるパスが SQLite の URI として開かれることのテスト"""
+        db_manager = DatabaseManager("file:uri_path_test?mode=memory&cache=shared")
+        case = CaseData()
+        case.case_number = "URI-TEST-001"
+        assert db_manager.save_case(case)
+        assert db_manager.load_case("URI-TEST-001") is not None
+        assert not Path("file:uri_path_test?mode=memory&cache=shared").exists()
+        db_manager.close()
+
+    def test_connection_reused_until_close(self, tmp_path):
+        """接続がインスタンス内で使い回され、close() 後は開き直されることのテスト"""
+        db_manager = DatabaseManager(str(tmp_path / "reuse.db"), tuning="fast")
+        assert db_manager.get_connection() is db_manager.get_connection()
+
+        case = CaseData()
+        case.case_number = "REUSE-TEST-001"
+        assert db_manager.save_case(case)
+
+        db_manager.close()
+        assert db_manager.load_case("REUSE-TEST-001") is not None
+        db_manager.close()
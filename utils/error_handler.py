@@ -73,15 +73,14 @@ class CompensationSystemError(Exception):
         self.recovery_suggestion = recovery_suggestion
         self.error_code = error_code
 
-# 具体的な例外クラス
+# 具体的な例外クラス（severity は既定値。呼び出し側で指定した場合はそちらを優先する）
 class ValidationError(CompensationSystemError):
     """入力値検証エラー"""
     def __init__(self, message: str, field_name: Optional[str] = None, **kwargs):
         super().__init__(
             message, 
             category=ErrorCategory.INPUT_VALIDATION,
-            severity=ErrorSeverity.LOW,
-            **kwargs
+            **{"severity": ErrorSeverity.LOW, **kwargs}
         )
         if field_name:
             self.context["field_name"] = field_name
@@ -92,8 +91,7 @@ class DatabaseError(CompensationSystemError):
         super().__init__(
             message, 
             category=ErrorCategory.DATABASE,
-            severity=ErrorSeverity.MEDIUM,
-            **kwargs
+            **{"severity": ErrorSeverity.MEDIUM, **kwargs}
         )
 
 class CalculationError(CompensationSystemError):
@@ -102,8 +100,7 @@ class CalculationError(CompensationSystemError):
         super().__init__(
             message, 
             category=ErrorCategory.CALCULATION,
-            severity=ErrorSeverity.HIGH,
-            **kwargs
+            **{"severity": ErrorSeverity.HIGH, **kwargs}
         )
 
 class ConfigurationError(CompensationSystemError):
@@ -112,8 +109,7 @@ class ConfigurationError(CompensationSystemError):
         super().__init__(
             message, 
             category=ErrorCategory.CONFIGURATION,
-            severity=ErrorSeverity.HIGH,
-            **kwargs
+            **{"severity": ErrorSeverity.HIGH, **kwargs}
         )
 
 class SecurityError(CompensationSystemError):
@@ -122,8 +118,7 @@ class SecurityError(CompensationSystemError):
         super().__init__(
             message,
             category=ErrorCategory.SECURITY,
-            severity=ErrorSeverity.HIGH,
-            **kwargs
+            **{"severity": ErrorSeverity.HIGH, **kwargs}
         )
 
 class FileIOError(CompensationSystemError):
@@ -132,8 +127,7 @@ class FileIOError(CompensationSystemError):
         super().__init__(
             message,
             category=ErrorCategory.FILE_IO,
-            severity=ErrorSeverity.MEDIUM,
-            **kwargs
+            **{"severity": ErrorSeverity.MEDIUM, **kwargs}
         )
         if file_path:
             self.context["file_path"] = file_path
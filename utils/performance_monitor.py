@@ -11,6 +11,7 @@
 - リアルタイム監視ダッシュボード
 """
 
+import os
 import time
 import threading
 import psutil
@@ -89,6 +90,9 @@ class PerformanceMonitor:
         # アラート履歴
         self.alerts: List[Dict[str, Any]] = []
         
+        # 自プロセスの psutil ハンドル（計測のたびに作り直さないようキャッシュする）
+        self._process: Optional[psutil.Process] = None
+        
         self.logger.info("パフォーマンス監視システムを初期化しました")
     
     def start_monitoring(self):
@@ -175,15 +179,22 @@ class PerformanceMonitor:
         del self._timing_data[operation_name]
         return elapsed
         
+    def _current_process(self) -> psutil.Process:
+        """自プロセスの psutil.Process を取得（fork 後は子プロセス用に作り直す）"""
+        pid = os.getpid()
+        if self._process is None or self._process.pid != pid:
+            self._process = psutil.Process(pid)
+        return self._process
+    
     def get_memory_usage(self) -> int:
-        """現在のメモリ使用量を取得（バイト単位）"""
-        return psutil.virtual_memory().used
+        """自プロセスの現在のメモリ使用量（RSS）を取得（バイト単位）"""
+        return self._current_process().memory_info().rss
     
     @contextmanager
     def measure_performance(self, function_name: str, parameters: Optional[Dict[str, Any]] = None):
         """パフォーマンス計測のコンテキストマネージャー"""
         start_time = time.time()
-        start_memory = psutil.Process().memory_info().rss
+        start_memory = self._current_process().memory_info().rss
         thread_id = threading.get_ident()
         
         success = True
@@ -198,7 +209,7 @@ class PerformanceMonitor:
             raise
         finally:
             end_time = time.time()
-            end_memory = psutil.Process().memory_info().rss
+            end_memory = self._current_process().memory_info().rss
             
             execution_time = end_time - start_time
             memory_usage = end_memory - start_memory
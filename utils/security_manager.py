@@ -172,17 +172,23 @@ class IntegratedSecurityManager:
             )
         }
 
-    @monitor_performance
+    @monitor_performance()
     def _init_audit_database(self):
         """監査ログデータベースの初期化"""
         try:
-            # データベースファイルのパス
-            db_dir = getattr(self.config, 'database_directory', './database')
-            os.makedirs(db_dir, exist_ok=True)
-            self.audit_db_path = os.path.join(db_dir, 'security_audit.db')
+            # 記録先が "memory" の場合はファイルに書き出さず、インスタンスが保持するメモリ上のDBに記録する
+            self._audit_memory_conn: Optional[sqlite3.Connection] = None
+            if getattr(self.security_config, 'audit_sink', 'sqlite') == 'memory':
+                self.audit_db_path = ':memory:'
+                self._audit_memory_conn = sqlite3.connect(':memory:', check_same_thread=False)
+            else:
+                # データベースファイルのパス
+                db_dir = getattr(self.config, 'database_directory', './database')
+                os.makedirs(db_dir, exist_ok=True)
+                self.audit_db_path = os.path.join(db_dir, 'security_audit.db')
             
             # データベース接続とテーブル作成
-            with sqlite3.connect(self.audit_db_path) as conn:
+            with self._audit_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS security_events (
@@ -224,7 +230,13 @@ class IntegratedSecurityManager:
                 )
             )
 
-    @monitor_performance
+    def _audit_connection(self) -> sqlite3.Connection:
+        """監査ログDBへの接続を取得（メモリ上のDBは同じ接続を使い回す）"""
+        if self._audit_memory_conn is not None:
+            return self._audit_memory_conn
+        return sqlite3.connect(self.audit_db_path)
+
+    @monitor_performance()
     def get_encryption_key(self, password: Optional[str] = None) -> bytes:
         """暗号化キーを取得"""
         if self._encryption_key is None:
@@ -252,7 +264,7 @@ class IntegratedSecurityManager:
             
         return self._encryption_key
 
-    @monitor_performance
+    @monitor_performance()
     def encrypt_data(self, data: Union[str, bytes, Dict[str, Any]], 
                     data_category: DataCategory,
                     user_id: Optional[str] = None) -> Tuple[bytes, Dict[str, Any]]:
@@ -263,14 +275,14 @@ class IntegratedSecurityManager:
             if not policy or not policy.encryption_required:
                 # 暗号化が不要な場合は元データを返す
                 if isinstance(data, dict):
-                    data = json.dumps(data, ensure_ascii=False)
+                    data = json.dumps(data, ensure_ascii=False, default=str)
                 if isinstance(data, str):
                     data = data.encode('utf-8')
                 return data, {'encrypted': False}
             
             # データを文字列に変換
             if isinstance(data, dict):
-                data_str = json.dumps(data, ensure_ascii=False)
+                data_str = json.dumps(data, ensure_ascii=False, default=str)
             elif isinstance(data, bytes):
                 data_str = data.decode('utf-8')
             else:
@@ -315,7 +327,7 @@ class IntegratedSecurityManager:
             )
             raise
 
-    @monitor_performance
+    @monitor_performance()
     def decrypt_data(self, encrypted_data: bytes, metadata: Dict[str, Any],
                     data_category: DataCategory,
                     user_id: Optional[str] = None) -> Union[str, Dict[str, Any]]:
@@ -388,7 +400,7 @@ class IntegratedSecurityManager:
         # 実際の実装では詳細な権限チェックを実装
         return True
 
-    @monitor_performance
+    @monitor_performance()
     def secure_report_generation(self, report_data: Dict[str, Any], 
                                report_type: str,
                                user_id: Optional[str] = None) -> Dict[str, Any]:
@@ -508,7 +520,7 @@ class IntegratedSecurityManager:
         
         # データベースに記録
         try:
-            with sqlite3.connect(self.audit_db_path) as conn:
+            with self._audit_connection() as conn:
                 cursor = conn.cursor()
                 cursor.execute('''
                     INSERT INTO security_events 
@@ -528,7 +540,7 @@ class IntegratedSecurityManager:
         except Exception as e:
             self.logger.error(f"セキュリティイベント記録エラー: {str(e)}")
 
-    @monitor_performance
+    @monitor_performance()
     def get_security_audit_report(self, start_date: Optional[datetime] = None,
                                 end_date: Optional[datetime] = None,
                                 user_id: Optional[str] = None) -> Dict[str, Any]:
@@ -540,7 +552,7 @@ class IntegratedSecurityManager:
             if not start_date:
                 start_date = end_date - timedelta(days=30)
             
-            with sqlite3.connect(self.audit_db_path) as conn:
+            with self._audit_connection() as conn:
                 cursor = conn.cursor()
                 
                 # 基本統計の取得